@@ -13,8 +13,24 @@ def main() -> None:
         action="store_true",
         help="print additional debug information to the console",
     )
+    parser.add_argument(
+        "--no-vsync",
+        action="store_true",
+        help="do not synchronise presents with the monitor refresh",
+    )
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=60,
+        help="frame rate cap; 0 runs uncapped (useful for benchmarking)",
+    )
     args = parser.parse_args()
-    run_pygame(cheat_enabled=args.cheat, debug=args.debug)
+    run_pygame(
+        cheat_enabled=args.cheat,
+        debug=args.debug,
+        vsync=not args.no_vsync,
+        target_fps=args.fps,
+    )
 
 
 if __name__ == "__main__":
@@ -117,37 +117,51 @@ class Game:
         impact_x: Optional[float] = None
         impact_y: Optional[float] = None
         dt = self.projectile_time_step
+        # Nothing below changes while the shell is in flight, so the lookups are
+        # hoisted out of the step loop; the AI planner runs this hundreds of
+        # times per turn.
+        world = self.world
+        gravity_step = self.gravity * dt
+        width = world.width
+        height = world.height
+        is_solid = world.is_solid
+        building_hit_test = world.building_hit_test if world.buildings else None
+        rubble_hit_test = world.rubble_hit_test if world.rubble_segments else None
+        targets = [
+            (tank, tank.x, tank.y)
+            for tank in self.tanks
+            if tank.alive and tank is not shooter
+        ]
+        append = path.append
         for _ in range(360):
             x += vx * dt
             y += vy * dt
-            vy += self.gravity * dt
-            path.append((x, y))
-            if x < 0 or x >= self.world.width or y >= self.world.height:
+            vy += gravity_step
+            append((x, y))
+            if x < 0 or x >= width or y >= height:
                 break
             if y < 0:
                 continue
-            ix = int(round(x))
-            iy = int(round(y))
-            building_hit = self.world.building_hit_test(x, y)
-            if building_hit:
-                hit_building, hit_floor = building_hit
-                impact_x, impact_y = x, y
-                break
-            rubble_hit = self.world.rubble_hit_test(x, y)
-            if rubble_hit:
-                hit_rubble = rubble_hit
-                impact_x, impact_y = x, y
-                break
-            for tank in self.tanks:
-                if not tank.alive or tank is shooter:
-                    continue
-                if abs(tank.x - x) <= 0.6 and abs(tank.y - y) <= 0.6:
+            if building_hit_test is not None:
+                building_hit = building_hit_test(x, y)
+                if building_hit:
+                    hit_building, hit_floor = building_hit
+                    impact_x, impact_y = x, y
+                    break
+            if rubble_hit_test is not None:
+                rubble_hit = rubble_hit_test(x, y)
+                if rubble_hit:
+                    hit_rubble = rubble_hit
+                    impact_x, impact_y = x, y
+                    break
+            for tank, tank_x, tank_y in targets:
+                if abs(tank_x - x) <= 0.6 and abs(tank_y - y) <= 0.6:
                     hit_tank = tank
                     impact_x, impact_y = x, y
                     break
             if hit_tank:
                 break
-            if self.world.is_solid(ix, iy):
+            if is_solid(int(round(x)), int(round(y))):
                 impact_x, impact_y = x, y
                 break
         result = ShotResult(
@@ -104,20 +104,24 @@ class GameSession:
         if self.projectile_result is None:
             return step
         self.projectile_timer += dt
+        steps = int(self.projectile_timer // self.projectile_interval)
+        if steps <= 0:
+            return step
+        self.projectile_timer -= steps * self.projectile_interval
         path = self.projectile_result.path
-        while self.projectile_timer >= self.projectile_interval:
-            self.projectile_timer -= self.projectile_interval
-            self.projectile_index += 1
-            if self.projectile_index >= len(path):
-                result = self.projectile_result
-                self.projectile_result = None
-                self.projectile_position = None
-                step.finished = True
-                step.result = result
-                return step
-            position = path[self.projectile_index]
-            self.projectile_position = position
-            step.trail_positions.append(position)
+        start = self.projectile_index + 1
+        end = self.projectile_index + steps
+        step.trail_positions = path[start : end + 1]
+        if end >= len(path):
+            result = self.projectile_result
+            self.projectile_result = None
+            self.projectile_position = None
+            self.projectile_index = len(path)
+            step.finished = True
+            step.result = result
+            return step
+        self.projectile_index = end
+        self.projectile_position = path[end]
         return step
 
     def resolve_projectile(self, result: Optional[ShotResult]) -> Optional[ShotResult]:
@@ -201,14 +205,14 @@ class GameSession:
         if result and result.hit_tank and result.hit_tank is not shooter:
             bonus = 0.75
         elif result and result.impact_x is not None and opponents:
-            distances = [
-                math.hypot(
-                    tank.x - result.impact_x,
-                    tank.y - (result.impact_y if result.impact_y is not None else tank.y),
-                )
+            impact_x = result.impact_x
+            impact_y = result.impact_y
+            # Usually a single opponent: take the minimum in one pass rather
+            # than materialising a distance list.
+            min_dist = min(
+                math.hypot(tank.x - impact_x, 0.0 if impact_y is None else tank.y - impact_y)
                 for tank in opponents
-            ]
-            min_dist = min(distances)
+            )
             if min_dist <= 0.5:
                 bonus = 0.6
             else:
@@ -120,6 +120,9 @@ class World:
         self.buildings: List[Building] = []
         self.rubble_segments: List[RubbleSegment] = []
         self._rubble_id_counter = 0
+        # Bumped whenever the height map is reshaped after generation so
+        # renderers can keep baked terrain until it actually changes.
+        self.terrain_revision = 0
         self._generate_height_map()
         self._generate_structures()
         self._pending_collapses: List[Building] = []
@@ -319,6 +322,8 @@ class World:
             if right_index < self.grid_width:
                 original = self.height_map[right_index]
                 self.height_map[right_index] = original * factor + target_height * (1.0 - factor)
+        self.terrain_revision += 1
+
     def building_hit_test(self, x: float, y: float) -> Optional[Tuple[Building, int]]:
         tolerance = 0.05
         horizontal_pad = 0.15
@@ -444,12 +449,12 @@ class World:
         return height - y
 
     def is_solid(self, x: int, y: int) -> bool:
-        if not self.is_inside(x, y):
+        # Hot path for projectile stepping: the bounds test is inlined and,
+        # with x non-negative, the column index only needs its upper clamp.
+        if not (0 <= x < self.width and 0 <= y < self.height):
             return False
-        center_y = y + 0.5
-        hx = min(self.grid_width - 1, max(0, int((x + 0.5) * self.detail)))
-        height = self.height_map[hx]
-        return center_y >= height
+        hx = min(self.grid_width - 1, int((x + 0.5) * self.detail))
+        return y + 0.5 >= self.height_map[hx]
 
     def highest_solid(self, x: int) -> Optional[int]:
         if not 0 <= x < self.width:
@@ -467,12 +472,32 @@ class World:
         if x_float < 0 or x_float > self.width - 1e-4:
             return None
         base = x_float * self.detail
-        ix = int(math.floor(base))
+        # base is non-negative past the bounds check, so truncation is floor.
+        ix = int(base)
         fx = base - ix
         h0 = self.height_map[ix]
         h1 = self.height_map[min(ix + 1, self.grid_width - 1)]
         return h0 * (1 - fx) + h1 * fx
 
+    def ground_heights(self, xs: Iterable[float]) -> List[Optional[float]]:
+        """Batch form of :meth:`ground_height` for several columns at once."""
+
+        limit = self.width - 1e-4
+        detail = self.detail
+        heights = self.height_map
+        last = self.grid_width - 1
+        result: List[Optional[float]] = []
+        for x_float in xs:
+            if x_float < 0 or x_float > limit:
+                result.append(None)
+                continue
+            base = x_float * detail
+            ix = int(base)
+            fx = base - ix
+            h1 = heights[ix + 1] if ix < last else heights[last]
+            result.append(heights[ix] * (1 - fx) + h1 * fx)
+        return result
+
     # ------------------------------------------------------------------
     # Terrain manipulation
     def carve_circle(self, cx: float, cy: float, radius: float) -> None:
@@ -507,6 +532,7 @@ class World:
                     self.height_map[hx] = max(self.settings.min_height, current - rim_height)
 
         self._smooth_heights(start, end, iterations=4)
+        self.terrain_revision += 1
 
     def carve_square(self, cx: float, cy: float, size: int = 4) -> None:
         radius = max(1.0, size) / math.sqrt(2)
@@ -537,20 +563,20 @@ class World:
     def _smooth_heights(self, start: int, end: int, iterations: int = 1) -> None:
         if start >= end:
             return
-        kernel = [0.15, 0.35, 0.35, 0.15]
-        half = len(kernel) // 2
-        temp = self.height_map[:]
+        w0, w1, w2, w3 = 0.15, 0.35, 0.35, 0.15
+        weight = 0.0 + w0 + w1 + w2 + w3
+        min_h = self.settings.min_height
+        max_h = self.settings.max_height
+        heights = self.height_map
         for _ in range(iterations):
-            for hx in range(start, end + 1):
-                accum = 0.0
-                weight = 0.0
-                for k, w in enumerate(kernel):
-                    offset = k - half
-                    idx = min(max(start, hx + offset), end)
-                    accum += temp[idx] * w
-                    weight += w
-                self.height_map[hx] = max(self.settings.min_height, min(self.settings.max_height, accum / weight))
-            temp = self.height_map[:]
+            window = heights[start : end + 1]
+            # Pad with the clamped edge samples so the 4-tap kernel (offsets
+            # -2..+1) can run as one pass over shifted slices.
+            padded = [window[0], window[0]] + window + [window[-1]]
+            heights[start : end + 1] = [
+                max(min_h, min(max_h, (a * w0 + b * w1 + c * w2 + d * w3) / weight))
+                for a, b, c, d in zip(padded, padded[1:], padded[2:], padded[3:])
+            ]
 
     def _value_noise(self, spacing: int) -> List[float]:
         spacing = max(1, spacing)
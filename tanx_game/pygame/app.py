@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import math
+import os
 import random
+from dataclasses import replace
 from importlib import resources
 from pathlib import Path
 from typing import List, Optional
@@ -47,10 +49,115 @@ from tanx_game.pygame.superpowers import SuperpowerManager
 from tanx_game.pygame.soundscape import Soundscape
 from tanx_game.pygame.textures import generate_cloud_layer, generate_noise_texture
 
+# Only these reach Python; mouse, joystick and window chatter stays in SDL.
+_HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP]
+
+# Simulation advances in fixed slices independent of the display rate; long
+# stalls (window drags, debugger pauses) are clamped instead of replayed.
+_UPDATE_STEP = 1.0 / 120.0
+_MAX_FRAME_TIME = 0.25
+
 
 class PygameTanx:
     """Graphical Tanx client built on top of the core game logic."""
 
+    # Every attribute is declared up front so instances carry no __dict__ and
+    # the per-frame self.* lookups in _update/_draw hit slot descriptors.
+    __slots__ = (
+        "ai_controller",
+        "cheat_enabled",
+        "cheat_menu_visible",
+        "clock",
+        "crater_rim_color",
+        "debug",
+        "display",
+        "effects",
+        "font_large",
+        "font_regular",
+        "font_small",
+        "ground_color",
+        "input",
+        "keybindings",
+        "logic",
+        "match_scores",
+        "menu",
+        "player_bindings",
+        "player_names",
+        "projectile_color",
+        "projectile_interval",
+        "rounds_played",
+        "running",
+        "session",
+        "settings_ai_difficulty_option_index",
+        "settings_ambient_volume_option_index",
+        "settings_direct_damage_option_index",
+        "settings_effects_volume_option_index",
+        "settings_fullscreen_option_index",
+        "settings_keybind_option_index",
+        "settings_master_volume_option_index",
+        "settings_resolution_option_index",
+        "settings_splash_damage_option_index",
+        "settings_style_option_index",
+        "settings_weather_option_index",
+        "sky_color_bottom",
+        "sky_color_top",
+        "smooth_upscale",
+        "soundscape",
+        "state",
+        "superpowers",
+        "tank_colors",
+        "target_fps",
+        "_ai_difficulties",
+        "_ai_difficulty_index",
+        "_ai_opponent_enabled",
+        "_ai_player_name",
+        "_audio_notice_menu_pending",
+        "_audio_notice_session_pending",
+        "_audio_path",
+        "_audio_status_last",
+        "_backdrop_cache",
+        "_backdrop_cache_key",
+        "_camera_offset",
+        "_camera_shake",
+        "_cloud_layers",
+        "_damage_ranges",
+        "_damage_settings",
+        "_damage_step",
+        "_distant_hills",
+        "_fonts",
+        "_human_player_two_name",
+        "_last_regular_settings",
+        "_menu_layout_cache",
+        "_menu_text_cache",
+        "_recoil_duration",
+        "_round_recorded",
+        "_settings_instructions",
+        "_sky_cache",
+        "_sky_cache_key",
+        "_skyline_shapes",
+        "_terrain_baked_heights",
+        "_terrain_cache_key",
+        "_terrain_descriptions",
+        "_terrain_hi_surface",
+        "_terrain_outline",
+        "_terrain_outline_origin",
+        "_terrain_outline_screen",
+        "_terrain_settings",
+        "_terrain_style_index",
+        "_terrain_styles",
+        "_terrain_surface",
+        "_terrain_texture",
+        "_time_elapsed",
+        "_ui_height",
+        "_user_settings",
+        "_visual_rng",
+        "_volume_categories",
+        "_volume_settings",
+        "_weather_descriptions",
+        "_weather_index",
+        "_weather_styles",
+    )
+
     def __init__(
         self,
         player_one: str = "Player 1",
@@ -62,9 +169,16 @@ class PygameTanx:
         cheat_enabled: bool = False,
         start_in_menu: bool = True,
         debug: bool = False,
+        vsync: bool = True,
+        target_fps: int = 60,
     ) -> None:
+        # Let SDL coalesce renderer draw calls wherever it backs the display
+        # with a texture renderer; respect an explicit user override.
+        os.environ.setdefault("SDL_RENDER_BATCHING", "1")
         pygame.init()
         pygame.font.init()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
         if not pygame.mixer.get_init():
             try:
                 pygame.mixer.init(frequency=44_100, size=-16, channels=2, buffer=512)
@@ -144,13 +258,23 @@ class PygameTanx:
             cell_size=cell_size,
             ui_height=ui_height,
             caption="Tanx - Arcade Duel",
+            vsync=vsync,
         )
 
         self.font_small = pygame.font.SysFont("consolas", 16)
         self.font_regular = pygame.font.SysFont("consolas", 20)
         self.font_large = pygame.font.SysFont(None, 48)
+        self._fonts = {
+            "small": self.font_small,
+            "regular": self.font_regular,
+            "large": self.font_large,
+        }
 
         self.clock = pygame.time.Clock()
+        # 0 removes the cap; simulation steps are dt-based, so game speed
+        # does not depend on the frame rate.
+        self.target_fps = max(0, int(target_fps))
+        self.smooth_upscale = False
         self.running = True
 
         self.player_names = [player_one, player_two]
@@ -171,6 +295,17 @@ class PygameTanx:
         self._terrain_texture = generate_noise_texture(96, alpha=24, seed=visual_seed)
         self._terrain_hi_surface: Optional[pygame.Surface] = None
         self._terrain_surface: Optional[pygame.Surface] = None
+        self._terrain_cache_key: Optional[tuple] = None
+        self._terrain_baked_heights: List[float] = []
+        self._terrain_outline: List[tuple[int, int]] = []
+        self._terrain_outline_origin: Optional[tuple[int, int]] = None
+        self._terrain_outline_screen: List[tuple[int, int]] = []
+        self._sky_cache: Optional[pygame.Surface] = None
+        self._sky_cache_key: Optional[tuple] = None
+        self._backdrop_cache: Optional[pygame.Surface] = None
+        self._backdrop_cache_key: Optional[tuple] = None
+        self._menu_text_cache: Optional[tuple] = None
+        self._menu_layout_cache: Optional[tuple] = None
         self._skyline_shapes: List[tuple[float, float, float, pygame.Color]] = []
         self._distant_hills: List[tuple[float, float]] = []
         self._cloud_layers = self._create_cloud_layers(visual_seed)
@@ -263,12 +398,12 @@ class PygameTanx:
             self._set_weather(self._weather_styles[self._weather_index]["key"])
         self._register_audio_banks()
 
-        self.sky_color_top = pygame.Color(78, 149, 205)
-        self.sky_color_bottom = pygame.Color(19, 57, 84)
-        self.ground_color = pygame.Color(87, 59, 32)
-        self.tank_colors = [pygame.Color(80, 200, 120), pygame.Color(237, 85, 59)]
-        self.projectile_color = pygame.Color(255, 231, 97)
-        self.crater_rim_color = pygame.Color(120, 93, 63)
+        self.sky_color_top = (78, 149, 205)
+        self.sky_color_bottom = (19, 57, 84)
+        self.ground_color = (87, 59, 32)
+        self.tank_colors = [(80, 200, 120), (237, 85, 59)]
+        self.projectile_color = (255, 231, 97)
+        self.crater_rim_color = (120, 93, 63)
 
         self._register_menus()
 
@@ -292,7 +427,7 @@ class PygameTanx:
             self._activate_menu("main_menu")
 
         if not self.display.windowed_fullscreen:
-            self._last_regular_settings = TerrainSettings(**vars(self.logic.world.settings))
+            self._last_regular_settings = replace(self.logic.world.settings)
 
         self._save_user_settings()
 
@@ -450,6 +585,9 @@ class PygameTanx:
     def _add_camera_shake(self, intensity: float) -> None:
         self._camera_shake = max(self._camera_shake, intensity)
 
+    def _text_surface(self, font_id: str, text: str, color) -> pygame.Surface:
+        return self.display.text_surface(self._fonts[font_id], text, tuple(color))
+
     def _play_ui_sound(self, key: str, *, volume: float | None = None) -> None:
         if getattr(self.soundscape, "enabled", False):
             self.soundscape.play(key, volume=volume)
@@ -589,7 +727,7 @@ class PygameTanx:
         if terrain_settings is None:
             effective_settings = TerrainSettings(seed=seed)
         else:
-            effective_settings = TerrainSettings(**vars(terrain_settings))
+            effective_settings = replace(terrain_settings)
             if seed is not None:
                 effective_settings.seed = seed
         effective_settings.style = self.terrain_style
@@ -604,13 +742,7 @@ class PygameTanx:
         self.player_names = [player_one, player_two]
         self._terrain_settings = self.logic.world.settings
 
-        self.display.configure_world(
-            self.logic.world.width,
-            self.logic.world.height,
-        )
-
-        self.effects.cell_size = self.cell_size
-        self.effects.ui_height = self.ui_height
+        self._rebind_display()
         self.effects.reset()
         self.effects.set_weather(self.weather)
         self.effects.set_wind(self._weather_wind_for(self.weather))
@@ -622,7 +754,7 @@ class PygameTanx:
         self._round_recorded = False
 
         if not self.display.windowed_fullscreen:
-            self._last_regular_settings = TerrainSettings(**vars(self.logic.world.settings))
+            self._last_regular_settings = replace(self.logic.world.settings)
 
         for tank in self.logic.tanks:
             tank.reset_super_power()
@@ -636,9 +768,19 @@ class PygameTanx:
             self.ai_controller.on_new_match()
             self.ai_controller.set_enabled(self._ai_opponent_enabled)
 
+    def _rebind_display(self) -> None:
+        """Fit the window, render target and effect metrics to the current world."""
+
+        self.display.configure_world(
+            self.logic.world.width,
+            self.logic.world.height,
+        )
+        self.effects.cell_size = self.cell_size
+        self.effects.ui_height = self.ui_height
+
     def _clone_current_settings(self) -> TerrainSettings:
         settings = self.logic.world.settings
-        return TerrainSettings(**vars(settings))
+        return replace(settings)
 
     def _apply_opponent_mode_to_names(self) -> None:
         if not self.player_names:
@@ -975,13 +1117,19 @@ class PygameTanx:
     def _apply_resolution(self, cell_size: int) -> None:
         if not self.display.apply_resolution(cell_size):
             return
-        settings = TerrainSettings(**vars(self._last_regular_settings))
-        self._setup_new_match(
-            self.player_names[0],
-            self.player_names[1],
-            settings,
-            settings.seed,
-        )
+        world = self.logic.world
+        settings = replace(self._last_regular_settings)
+        if (world.width, world.height) == (settings.width, settings.height):
+            # Only the cell size changed; the world keeps its dimensions in
+            # cells, so reflow the display rather than regenerating terrain.
+            self._rebind_display()
+        else:
+            self._setup_new_match(
+                self.player_names[0],
+                self.player_names[1],
+                settings,
+                settings.seed,
+            )
         if self.state == "settings_menu":
             self._update_settings_menu_options()
         self._save_user_settings()
@@ -1300,14 +1448,24 @@ class PygameTanx:
     def run(self) -> None:
         """Main pygame loop."""
 
+        # The frame cap still applies when vsync is unavailable. Setting
+        # TANX_BUSY_WAIT trades a spinning wait for tighter frame pacing than
+        # the coarse sleep behind Clock.tick.
+        tick = self.clock.tick_busy_loop if os.environ.get("TANX_BUSY_WAIT") else self.clock.tick
+        target_fps = self.target_fps
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            accumulator = min(accumulator + tick(target_fps) / 1000.0, _MAX_FRAME_TIME)
             self._handle_events()
-            self._update(dt)
+            while accumulator >= _UPDATE_STEP:
+                self._update(_UPDATE_STEP)
+                accumulator -= _UPDATE_STEP
             self._draw()
         pygame.quit()
 
     def _handle_events(self) -> None:
+        # Only _HANDLED_EVENTS are allowed onto the queue, so an unfiltered get
+        # drains it in one SDL call instead of one peep per event type.
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -1374,12 +1532,15 @@ class PygameTanx:
             self.session.on_building_collapse(affected, fatalities)
 
         # Suspension animation for tanks
+        wind = self.effects.wind
+        time_elapsed = self._time_elapsed
+        sin = math.sin
+        phase_speed = 3.2 + abs(wind) * 0.5
         for idx, tank in enumerate(self.logic.tanks):
             if not tank.alive:
                 continue
-            phase_speed = 3.2 + abs(self.effects.wind) * 0.5
             tank.suspension_phase = (tank.suspension_phase + dt * phase_speed) % (math.tau)
-            base_amp = 0.05 + 0.02 * math.sin(self._time_elapsed * 0.9 + idx)
+            base_amp = 0.05 + 0.02 * sin(time_elapsed * 0.9 + idx)
             if tank.last_command in {"left", "right"}:
                 base_amp += 0.04
             tank.suspension_amplitude = base_amp
@@ -1387,11 +1548,11 @@ class PygameTanx:
 
         # Ambient sway for skyline when windy
         if self._skyline_shapes:
+            wind_term = wind * 0.04
+            sway_time = time_elapsed * 0.7
             for shape in self._skyline_shapes:
                 base_height = shape["base_height"]
-                phase = shape["phase"]
-                wind_term = self.effects.wind * 0.04
-                sway = math.sin(self._time_elapsed * 0.7 + phase) * 0.05 + wind_term
+                sway = sin(sway_time + shape["phase"]) * 0.05 + wind_term
                 shape["height"] = max(base_height * 0.6, base_height * (1.0 + sway))
         power_finished = self.superpowers.update(dt)
         if power_finished and self.session.superpower_active_player is not None:
@@ -1424,8 +1585,9 @@ class PygameTanx:
             return
 
         step = self.session.update_projectile(dt)
+        spawn_trail = self.effects.spawn_trail
         for position in step.trail_positions:
-            self.effects.spawn_trail(position)
+            spawn_trail(position)
         if step.finished:
             self._handle_projectile_resolution(step.result)
 
@@ -1468,8 +1630,11 @@ class PygameTanx:
             self._add_camera_shake(scale * 0.7)
 
     def _draw(self) -> None:
-        target_surface = self.screen
-        target_surface.fill((0, 0, 0))
+        if not pygame.display.get_active():
+            # Minimised or hidden windows show nothing; keep simulating but
+            # skip painting until the window is back on screen.
+            return
+        # draw_background paints the full-screen sky first, so no clear is needed.
         draw_background(self)
         draw_world(self)
         draw_rubble(self)
@@ -1491,12 +1656,24 @@ class PygameTanx:
             draw_menu_overlay(self)
 
         if self.render_surface is not None:
-            if self.render_surface.get_size() == self.display_surface.get_size():
+            render_w, render_h = self.render_surface.get_size()
+            display_w, display_h = self.display_surface.get_size()
+            if (render_w, render_h) == (display_w, display_h):
                 self.display_surface.blit(self.render_surface, (0, 0))
+            elif not self.smooth_upscale and abs(
+                render_w * display_h - display_w * render_h
+            ) <= 0.01 * display_w * render_h:
+                # Same aspect ratio: nearest-neighbour keeps the flat-shaded
+                # art crisp and skips smoothscale's per-pixel filtering.
+                pygame.transform.scale(
+                    self.render_surface,
+                    (display_w, display_h),
+                    self.display_surface,
+                )
             else:
                 pygame.transform.smoothscale(
                     self.render_surface,
-                    self.display_surface.get_size(),
+                    (display_w, display_h),
                     self.display_surface,
                 )
         pygame.display.flip()
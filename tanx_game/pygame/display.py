@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from typing import List, Optional, Tuple
 
 import pygame
 
 from tanx_game.core.world import TerrainSettings
 
+_TEXT_CACHE_SIZE = 256
+
 
 @dataclass(frozen=True)
 class ResolutionPreset:
@@ -22,8 +25,11 @@ class ResolutionPreset:
 class DisplayManager:
     """Encapsulate pygame display surfaces and resolution handling."""
 
-    def __init__(self, *, cell_size: int, ui_height: int, caption: str) -> None:
+    def __init__(
+        self, *, cell_size: int, ui_height: int, caption: str, vsync: bool = True
+    ) -> None:
         self.caption = caption
+        self.vsync = vsync
         self.cell_size = cell_size
         self.ui_height = ui_height
 
@@ -44,7 +50,7 @@ class DisplayManager:
             info.current_h or 480,
         )
         self._display_flags = pygame.FULLSCREEN
-        self.display_surface = pygame.display.set_mode(initial_size, self._display_flags)
+        self.display_surface = self._open_display(initial_size, self._display_flags)
         self.fullscreen_size = self.display_surface.get_size()
         pygame.display.set_caption(self.caption)
 
@@ -52,14 +58,37 @@ class DisplayManager:
         self._screen: pygame.Surface = self.display_surface
         self.playfield_offset_x = 0
 
-        self.resolution_presets: List[ResolutionPreset] = []
+        self.resolution_presets: Tuple[ResolutionPreset, ...] = ()
         self.resolution_index = 0
+        self._presets_key: Optional[tuple] = None
+
+        self._text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
 
     # ------------------------------------------------------------------
     @property
     def screen(self) -> pygame.Surface:
         return self._screen
 
+    def text_surface(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, ...]
+    ) -> pygame.Surface:
+        """Return ``text`` rendered in ``font``, converted to the display format.
+
+        Surfaces are kept in a small LRU so strings repeated across frames
+        are rasterised once per display mode.
+        """
+
+        key = (font, text, color)
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+            return cached
+        surface = font.render(text, True, color).convert_alpha()
+        self._text_cache[key] = surface
+        if len(self._text_cache) > _TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return surface
+
     def configure_world(self, world_width: int, world_height: int) -> None:
         self.world_width = world_width
         self.world_height = world_height
@@ -75,28 +104,35 @@ class DisplayManager:
         self._update_render_target()
         self._sync_resolution_presets()
 
+    def _open_display(self, size: Tuple[int, int], flags: int) -> pygame.Surface:
+        # Ask SDL to pace presents to the monitor refresh; drivers that cannot
+        # honour vsync for this mode raise, so retry without it. For plain
+        # software windows (no SCALED/OPENGL) SDL accepts the request but does
+        # not pace presents, and pygame cannot report which happened, so
+        # PygameTanx.run keeps its own frame cap either way.
+        if not self.vsync:
+            return pygame.display.set_mode(size, flags)
+        try:
+            return pygame.display.set_mode(size, flags, vsync=1)
+        except pygame.error:
+            return pygame.display.set_mode(size, flags)
+
     def _set_display_mode(self, size: Tuple[int, int], flags: int = 0) -> None:
         if self._display_flags != flags or self.display_surface.get_size() != size:
-            self.display_surface = pygame.display.set_mode(size, flags)
+            self.display_surface = self._open_display(size, flags)
             self._display_flags = flags
+            self._text_cache.clear()
             pygame.display.set_caption(self.caption)
 
     def _update_render_target(self) -> None:
-        if self.windowed_fullscreen:
-            width = self.world_width * self.cell_size
-            height = self.world_height * self.cell_size + self.ui_height
-            desired = (width, height)
-            if self.render_surface is None or self.render_surface.get_size() != desired:
-                surface = pygame.Surface(desired).convert_alpha()
-                surface.fill((0, 0, 0))
-                self.render_surface = surface
-            self._screen = self.render_surface
-        elif self._display_flags & pygame.FULLSCREEN:
-            width = self.world_width * self.cell_size
-            height = self.world_height * self.cell_size + self.ui_height
-            desired = (width, height)
+        desired = (
+            self.world_width * self.cell_size,
+            self.world_height * self.cell_size + self.ui_height,
+        )
+        scaled = self.windowed_fullscreen or bool(self._display_flags & pygame.FULLSCREEN)
+        if scaled and desired != self.display_surface.get_size():
             if self.render_surface is None or self.render_surface.get_size() != desired:
-                surface = pygame.Surface(desired).convert_alpha()
+                surface = pygame.Surface(desired).convert(self.display_surface)
                 surface.fill((0, 0, 0))
                 self.render_surface = surface
             self._screen = self.render_surface
@@ -116,21 +152,24 @@ class DisplayManager:
     def _sync_resolution_presets(self) -> None:
         if self.world_width <= 0 or self.world_height <= 0:
             return
-        unique_sizes = sorted(set(self._supported_cell_sizes + [self.cell_size]))
-        presets: List[ResolutionPreset] = []
-        for size in unique_sizes:
-            width = self.world_width * size
-            height = self.world_height * size + self.ui_height
-            presets.append(
-                ResolutionPreset(
-                    cell_size=size,
-                    label=f"{width}×{height}",
-                    size=(width, height),
+        unique_sizes = tuple(sorted(set(self._supported_cell_sizes + [self.cell_size])))
+        key = (self.world_width, self.world_height, self.ui_height, unique_sizes)
+        if key != self._presets_key:
+            presets: List[ResolutionPreset] = []
+            for size in unique_sizes:
+                width = self.world_width * size
+                height = self.world_height * size + self.ui_height
+                presets.append(
+                    ResolutionPreset(
+                        cell_size=size,
+                        label=f"{width}×{height}",
+                        size=(width, height),
+                    )
                 )
-            )
-        self.resolution_presets = presets
+            self.resolution_presets = tuple(presets)
+            self._presets_key = key
         self.resolution_index = 0
-        for idx, preset in enumerate(presets):
+        for idx, preset in enumerate(self.resolution_presets):
             if preset.cell_size == self.cell_size:
                 self.resolution_index = idx
                 break
@@ -181,8 +220,7 @@ class DisplayManager:
             self._supported_cell_sizes.sort()
 
         width_cells = max(base_settings.width, max(1, width // max(1, cell_size)))
-        new_settings = TerrainSettings(**vars(base_settings))
-        new_settings.width = width_cells
+        new_settings = replace(base_settings, width=width_cells)
 
         self.windowed_fullscreen = True
         self.windowed_fullscreen_size = (width, height)
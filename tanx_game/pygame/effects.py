@@ -5,15 +5,16 @@ from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass
-from typing import List, Tuple
-
-import pygame
+from typing import List, Sequence, Tuple
 
 from tanx_game.core.game import ShotResult
 from tanx_game.core.tank import Tank
 
+# Weather refills one spawn batch per 1/60 s while below its target count.
+_DROP_BATCHES_PER_SECOND = 60.0
+
 
-@dataclass
+@dataclass(slots=True)
 class Particle:
     x: float
     y: float
@@ -26,7 +27,7 @@ class Particle:
     kind: str = "generic"
 
 
-@dataclass
+@dataclass(slots=True)
 class Debris:
     x: float
     y: float
@@ -41,17 +42,6 @@ class Debris:
     color: Tuple[int, int, int]
 
 
-@dataclass
-class WeatherDrop:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    length: float
-    life: float
-    max_life: float
-
-
 class EffectsSystem:
     """Encapsulates simulation state for particles, debris, and explosions."""
 
@@ -77,7 +67,16 @@ class EffectsSystem:
         self.debris: List[Debris] = []
         self.smoke: List[Particle] = []
         self.embers: List[Particle] = []
-        self.weather_drops: List[WeatherDrop] = []
+        # Weather drops are stored column-wise: a steady rain or snowfall
+        # keeps a couple of hundred of them alive and moving every frame.
+        self.drop_x: List[float] = []
+        self.drop_y: List[float] = []
+        self.drop_vx: List[float] = []
+        self.drop_vy: List[float] = []
+        self.drop_length: List[float] = []
+        # Fractional drops owed to the spawner, so refill follows elapsed time
+        # rather than the number of update calls.
+        self.drop_spawn_credit = 0.0
         self.weather_type: str = "clear"
         self.wind: float = 0.0
 
@@ -211,7 +210,7 @@ class EffectsSystem:
         self,
         result: ShotResult,
         tanks: List[Tank],
-        tank_colors: List[pygame.Color],
+        tank_colors: Sequence[Tuple[int, int, int]],
     ) -> None:
         if result.fatal_tank is None:
             return
@@ -222,6 +221,7 @@ class EffectsSystem:
             if tank is result.fatal_tank:
                 tank_color = tank_colors[idx % len(tank_colors)]
                 break
+        tank_r, tank_g, tank_b = tank_color[:3]
 
         for _ in range(8):
             angle = random.uniform(-math.pi * 0.9, -math.pi * 0.1)
@@ -246,9 +246,9 @@ class EffectsSystem:
                     width=width,
                     height=height,
                     color=(
-                        max(0, tank_color.r - 40),
-                        max(0, tank_color.g - 40),
-                        max(0, tank_color.b - 40),
+                        max(0, tank_r - 40),
+                        max(0, tank_g - 40),
+                        max(0, tank_b - 40),
                     ),
                 )
             )
@@ -267,7 +267,7 @@ class EffectsSystem:
                 max_life=2.8,
                 width=int(max(12, self.cell_size * 1.1)),
                 height=int(max(6, self.cell_size * 0.5)),
-                color=(tank_color.r, tank_color.g, tank_color.b),
+                color=(tank_r, tank_g, tank_b),
             )
         )
 
@@ -394,11 +394,12 @@ class EffectsSystem:
         if not self.particles:
             return
         alive: List[Particle] = []
+        gravity_step = self.particle_gravity * dt
         for particle in self.particles:
             particle.life -= dt
             if particle.life <= 0:
                 continue
-            particle.vy += self.particle_gravity * dt
+            particle.vy += gravity_step
             particle.x += particle.vx * dt
             particle.y += particle.vy * dt
             if -2 <= particle.x <= world.width + 2:
@@ -424,11 +425,12 @@ class EffectsSystem:
         if not self.debris:
             return
         alive: List[Debris] = []
+        gravity_step = (self.particle_gravity * 0.6) * dt
         for chunk in self.debris:
             chunk.life -= dt
             if chunk.life <= 0:
                 continue
-            chunk.vy += (self.particle_gravity * 0.6) * dt
+            chunk.vy += gravity_step
             chunk.x += chunk.vx * dt
             chunk.y += chunk.vy * dt
             chunk.angle += chunk.angular_velocity * dt
@@ -455,11 +457,12 @@ class EffectsSystem:
         if not self.smoke:
             return
         alive: List[Particle] = []
+        drift_step = self.wind * 0.25 * dt
         for particle in self.smoke:
             particle.life -= dt
             if particle.life <= 0:
                 continue
-            particle.vx += self.wind * 0.25 * dt
+            particle.vx += drift_step
             particle.x += particle.vx * dt
             particle.y += particle.vy * dt
             particle.radius = min(particle.radius * 1.02, particle.radius + 0.02)
@@ -470,11 +473,12 @@ class EffectsSystem:
         if not self.embers:
             return
         alive: List[Particle] = []
+        gravity_step = self.particle_gravity * 0.15 * dt
         for ember in self.embers:
             ember.life -= dt
             if ember.life <= 0:
                 continue
-            ember.vy += self.particle_gravity * 0.15 * dt
+            ember.vy += gravity_step
             ember.x += ember.vx * dt
             ember.y += ember.vy * dt
             alive.append(ember)
@@ -485,17 +489,31 @@ class EffectsSystem:
     def set_weather(self, weather: str) -> None:
         if weather != self.weather_type:
             self.weather_type = weather
-            self.weather_drops.clear()
+            self._clear_weather_drops()
+
+    def _clear_weather_drops(self) -> None:
+        self.drop_x.clear()
+        self.drop_y.clear()
+        self.drop_vx.clear()
+        self.drop_vy.clear()
+        self.drop_length.clear()
+        self.drop_spawn_credit = 0.0
 
     def update_weather(self, dt: float, width: float, height: float) -> None:
         if self.weather_type == "clear":
-            self.weather_drops.clear()
+            self._clear_weather_drops()
             return
-        drops = self.weather_drops
         target_count = 160 if self.weather_type == "rain" else 220
         spawn_batch = max(4, target_count // 12)
-        if len(drops) < target_count:
-            for _ in range(spawn_batch):
+        spawn_count = 0
+        if len(self.drop_x) < target_count:
+            self.drop_spawn_credit += spawn_batch * _DROP_BATCHES_PER_SECOND * dt
+            spawn_count = int(self.drop_spawn_credit)
+            self.drop_spawn_credit -= spawn_count
+        else:
+            self.drop_spawn_credit = 0.0
+        if spawn_count:
+            for _ in range(spawn_count):
                 if self.weather_type == "rain":
                     vx = self.wind * 0.8 + random.uniform(-0.6, 0.6)
                     vy = random.uniform(10.0, 14.0)
@@ -504,30 +522,30 @@ class EffectsSystem:
                     vx = self.wind * 0.4 + random.uniform(-0.4, 0.4)
                     vy = random.uniform(1.6, 2.8)
                     length = random.uniform(0.28, 0.42)
-                drops.append(
-                    WeatherDrop(
-                        x=random.uniform(-1.0, width + 1.0),
-                        y=random.uniform(-1.0, 0.0),
-                        vx=vx,
-                        vy=vy,
-                        length=length,
-                        life=0.0,
-                        max_life=height / max(vy, 0.1),
-                    )
-                )
-
-        alive: List[WeatherDrop] = []
-        for drop in drops:
-            drop.life += dt
-            drop.x += drop.vx * dt
-            drop.y += drop.vy * dt
-            if drop.y > height + 1.0 or drop.x < -1.5 or drop.x > width + 1.5:
-                continue
-            alive.append(drop)
-        self.weather_drops = alive
+                self.drop_x.append(random.uniform(-1.0, width + 1.0))
+                self.drop_y.append(random.uniform(-1.0, 0.0))
+                self.drop_vx.append(vx)
+                self.drop_vy.append(vy)
+                self.drop_length.append(length)
+
+        xs = [x + vx * dt for x, vx in zip(self.drop_x, self.drop_vx)]
+        ys = [y + vy * dt for y, vy in zip(self.drop_y, self.drop_vy)]
+        bottom = height + 1.0
+        right = width + 1.5
+        keep = [
+            i for i, (x, y) in enumerate(zip(xs, ys)) if y <= bottom and -1.5 <= x <= right
+        ]
+        if len(keep) != len(xs):
+            xs = [xs[i] for i in keep]
+            ys = [ys[i] for i in keep]
+            self.drop_vx = [self.drop_vx[i] for i in keep]
+            self.drop_vy = [self.drop_vy[i] for i in keep]
+            self.drop_length = [self.drop_length[i] for i in keep]
+        self.drop_x = xs
+        self.drop_y = ys
 
     def set_wind(self, wind: float) -> None:
         self.wind = wind
 
 
-__all__ = ["EffectsSystem", "Particle", "Debris", "WeatherDrop"]
+__all__ = ["EffectsSystem", "Particle", "Debris"]
@@ -2,10 +2,42 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Callable, Dict
+
 import pygame
 from tanx_game.pygame.keybindings import KeyBindings
 
 
+# Gameplay actions in the order the bindings are checked; when two actions
+# share a key, the earlier one wins, matching the original if-chain.
+_ACTION_ORDER = (
+    ("move_left", "_move_left"),
+    ("move_right", "_move_right"),
+    ("turret_up", "_turret_up"),
+    ("turret_down", "_turret_down"),
+    ("power_increase", "_power_increase"),
+    ("power_decrease", "_power_decrease"),
+    ("fire", "_fire"),
+)
+
+
+@lru_cache(maxsize=16)
+def _gameplay_actions(binding_items: tuple) -> Dict[int, Callable]:
+    """Map each bound key to its InputHandler action for one binding set.
+
+    ``binding_items`` is the ``(field, key)`` snapshot of a
+    :class:`KeyBindings`, so rebinding a key yields a new table while the
+    common case is a single dict lookup per key press.
+    """
+
+    by_field = dict(binding_items)
+    table: Dict[int, Callable] = {}
+    for field_name, method_name in reversed(_ACTION_ORDER):
+        table[by_field[field_name]] = getattr(InputHandler, method_name)
+    return table
+
+
 class InputHandler:
     """Translate pygame events into application actions."""
 
@@ -94,42 +126,43 @@ class InputHandler:
         if app.is_ai_controlled(app.current_player):
             return
 
-        tank = current_tank
         bindings = app.player_bindings[app.current_player]
+        handler = _gameplay_actions(tuple(vars(bindings).items())).get(key)
+        if handler is not None:
+            handler(self, current_tank, turret_step, power_step)
 
-        if key == bindings.move_left:
-            app._attempt_move(tank, -1)
-            return
-        if key == bindings.move_right:
-            app._attempt_move(tank, 1)
-            return
-        if key == bindings.turret_up:
-            tank.raise_turret(amount=turret_step)
-            app.message = f"{tank.name} turret: {tank.turret_angle}°"
-            return
-        if key == bindings.turret_down:
-            tank.lower_turret(amount=turret_step)
-            app.message = f"{tank.name} turret: {tank.turret_angle}°"
-            return
-        if key == bindings.power_increase:
-            previous = tank.shot_power
-            tank.increase_power(amount=power_step)
-            if tank.shot_power == previous:
-                app.message = f"{tank.name} power already max"
-            else:
-                app.message = f"{tank.name} power: {tank.shot_power:.2f}x"
-            return
-        if key == bindings.power_decrease:
-            previous = tank.shot_power
-            tank.decrease_power(amount=power_step)
-            if tank.shot_power == previous:
-                app.message = f"{tank.name} power already min"
-            else:
-                app.message = f"{tank.name} power: {tank.shot_power:.2f}x"
-            return
-        if key == bindings.fire:
-            app._fire_projectile(tank)
-            return
+    def _move_left(self, tank, turret_step: int, power_step: float) -> None:
+        self.app._attempt_move(tank, -1)
+
+    def _move_right(self, tank, turret_step: int, power_step: float) -> None:
+        self.app._attempt_move(tank, 1)
+
+    def _turret_up(self, tank, turret_step: int, power_step: float) -> None:
+        tank.raise_turret(amount=turret_step)
+        self.app.message = f"{tank.name} turret: {tank.turret_angle}°"
+
+    def _turret_down(self, tank, turret_step: int, power_step: float) -> None:
+        tank.lower_turret(amount=turret_step)
+        self.app.message = f"{tank.name} turret: {tank.turret_angle}°"
+
+    def _power_increase(self, tank, turret_step: int, power_step: float) -> None:
+        previous = tank.shot_power
+        tank.increase_power(amount=power_step)
+        if tank.shot_power == previous:
+            self.app.message = f"{tank.name} power already max"
+        else:
+            self.app.message = f"{tank.name} power: {tank.shot_power:.2f}x"
+
+    def _power_decrease(self, tank, turret_step: int, power_step: float) -> None:
+        previous = tank.shot_power
+        tank.decrease_power(amount=power_step)
+        if tank.shot_power == previous:
+            self.app.message = f"{tank.name} power already min"
+        else:
+            self.app.message = f"{tank.name} power: {tank.shot_power:.2f}x"
+
+    def _fire(self, tank, turret_step: int, power_step: float) -> None:
+        self.app._fire_projectile(tank)
 
     def update(self, dt: float) -> None:
         app = self.app
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Callable, List, Optional
 
 import pygame
 
 
+@lru_cache(maxsize=512)
+def _key_label(key: int) -> str:
+    # SDL key codes are fixed, so each label only needs resolving once.
+    return pygame.key.name(key).upper()
+
+
 @dataclass
 class KeyBindings:
     move_left: int
@@ -53,7 +60,7 @@ class KeybindingManager:
             ),
         ]
         self.player_bindings: List[KeyBindings] = [
-            KeyBindings(**vars(binding)) for binding in self.default_bindings
+            replace(binding) for binding in self.default_bindings
         ]
         self.rebinding_target: Optional[tuple[int, str]] = None
 
@@ -86,13 +93,12 @@ class KeybindingManager:
         if restored:
             # Ensure we maintain exactly two players worth of bindings.
             while len(restored) < len(self.default_bindings):
-                restored.append(KeyBindings(**vars(self.default_bindings[len(restored)])))
+                restored.append(replace(self.default_bindings[len(restored)]))
             self.player_bindings = restored[: len(self.default_bindings)]
 
     # ------------------------------------------------------------------
     def format_key(self, key: int) -> str:
-        name = pygame.key.name(key)
-        return name.upper()
+        return _key_label(key)
 
     def start_rebinding(self, player_idx: int, field: str) -> str:
         self.rebinding_target = (player_idx, field)
@@ -134,7 +140,7 @@ class KeybindingManager:
 
     def reset_to_defaults(self) -> str:
         self.player_bindings = [
-            KeyBindings(**vars(binding)) for binding in self.default_bindings
+            replace(binding) for binding in self.default_bindings
         ]
         self.rebinding_target = None
         return "Key bindings reset to defaults."
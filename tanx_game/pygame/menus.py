@@ -3,9 +3,69 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
 import pygame
 
+# Fixed HUD and menu colours, kept as plain tuples so draw calls do not
+# allocate a pygame.Color every frame.
+_WHITE = (255, 255, 255)
+_TEXT_COLOR = (230, 230, 230)
+_TEXT_MUTED = (180, 188, 200)
+_DIAL_BASE = (30, 34, 48)
+_DIAL_RING = (80, 86, 110)
+_DIAL_GUIDE = (55, 62, 84)
+_BAR_TRACK = (36, 40, 54)
+_BAR_BORDER = (14, 16, 24)
+_HEALTH_LOW = (210, 80, 80)
+_HEALTH_MID = (230, 180, 90)
+_HEALTH_HIGH = (120, 200, 120)
+_POWER_COLOR = (90, 160, 230)
+_SUPER_READY = (240, 200, 90)
+_SUPER_CHARGING = (200, 120, 230)
+_MENU_MESSAGE = (220, 220, 220)
+_MENU_OPTION = (200, 200, 200)
+_MENU_FOOTER = (180, 180, 180)
+
+
+@lru_cache(maxsize=8)
+def _translucent_overlay(
+    size: tuple[int, int], color: tuple[int, int, int, int]
+) -> pygame.Surface:
+    """Return a reusable ``size`` surface filled with the translucent ``color``.
+
+    The HUD panel and the menu and cheat-console dimmers are blitted every
+    frame; allocating and filling a fresh screen-sized surface each time was
+    pure overhead.
+    """
+
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    overlay.fill(color)
+    return overlay.convert_alpha()
+
+
+@lru_cache(maxsize=None)
+def _instructions_text(ai_opponent: bool, cheat_enabled: bool) -> str:
+    """Return the HUD controls line for the given opponent and cheat modes."""
+
+    instruction_parts = [
+        "P1: A/D move, W/S aim, Space fire, Q/E power",
+    ]
+    if ai_opponent:
+        instruction_parts.append("P2: Computer controlled opponent")
+    else:
+        instruction_parts.append("P2: ←/→ move, ↑/↓ aim, Enter fire, [,/.] power")
+    instruction_parts.extend(
+        [
+            "Superpowers: B bomber, N squad, M scope",
+            "Hold Shift: coarse aim & power",
+            "Esc: pause menu",
+        ]
+    )
+    if cheat_enabled:
+        instruction_parts.append("F1: cheat console")
+    return "   |   ".join(instruction_parts)
+
 
 def draw_ui(app) -> None:
     surface = app.screen
@@ -14,16 +74,14 @@ def draw_ui(app) -> None:
     panel_top = height - panel_height
 
     # Draw a translucent panel at the bottom of the screen
-    overlay = pygame.Surface((width, panel_height), pygame.SRCALPHA)
-    overlay.fill((10, 12, 20, 235))
-    surface.blit(overlay, (0, panel_top))
+    surface.blit(_translucent_overlay((width, panel_height), (10, 12, 20, 235)), (0, panel_top))
 
     base_stats_top = panel_top + 12
     section_padding = 20
     bar_height = 16
     bar_spacing = 6
-    text_color = pygame.Color(230, 230, 230)
-    text_muted = pygame.Color(180, 188, 200)
+    text_color = _TEXT_COLOR
+    text_muted = _TEXT_MUTED
 
     def clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
         return max(minimum, min(maximum, value))
@@ -34,9 +92,9 @@ def draw_ui(app) -> None:
         return math.radians(180 - angle_deg)
 
     def draw_angle_dial(center: tuple[int, int], radius: int, tank, tank_index: int) -> None:
-        base_color = pygame.Color(30, 34, 48)
-        ring_color = pygame.Color(80, 86, 110)
-        guide_color = pygame.Color(55, 62, 84)
+        base_color = _DIAL_BASE
+        ring_color = _DIAL_RING
+        guide_color = _DIAL_GUIDE
         accent = pygame.Color(app.tank_colors[tank_index % len(app.tank_colors)])
         if tank_index == app.current_player:
             accent = pygame.Color(
@@ -74,7 +132,7 @@ def draw_ui(app) -> None:
         pygame.draw.line(surface, accent, center, pointer_end, 3)
         pygame.draw.circle(surface, accent, pointer_end, 4)
 
-        angle_surface = app.font_small.render(f"{tank.turret_angle}°", True, text_color)
+        angle_surface = app._text_surface("small", f"{tank.turret_angle}°", text_color)
         angle_rect = angle_surface.get_rect(center=center)
         surface.blit(angle_surface, angle_rect)
 
@@ -83,27 +141,27 @@ def draw_ui(app) -> None:
         ratio: float,
         label: str,
         value_text: str,
-        fill_color: pygame.Color,
+        fill_color: tuple[int, int, int],
     ) -> None:
-        pygame.draw.rect(surface, pygame.Color(36, 40, 54), bar_rect, border_radius=6)
+        pygame.draw.rect(surface, _BAR_TRACK, bar_rect, border_radius=6)
         fill_width = int(bar_rect.width * clamp(ratio))
         if fill_width > 0:
             fill_rect = pygame.Rect(bar_rect.left, bar_rect.top, fill_width, bar_rect.height)
             pygame.draw.rect(surface, fill_color, fill_rect, border_radius=6)
-        pygame.draw.rect(surface, pygame.Color(14, 16, 24), bar_rect, width=1, border_radius=6)
+        pygame.draw.rect(surface, _BAR_BORDER, bar_rect, width=1, border_radius=6)
 
-        label_surface = app.font_small.render(label, True, text_color)
+        label_surface = app._text_surface("small", label, text_color)
         label_rect = label_surface.get_rect(left=bar_rect.left + 8, centery=bar_rect.centery)
         surface.blit(label_surface, label_rect)
 
-        value_surface = app.font_small.render(value_text, True, text_muted)
+        value_surface = app._text_surface("small", value_text, text_muted)
         value_rect = value_surface.get_rect(right=bar_rect.right - 8, centery=bar_rect.centery)
         surface.blit(value_surface, value_rect)
 
     message = app.message or ""
     message_bottom = panel_top + 6
     if message:
-        message_surface = app.font_regular.render(message, True, text_color)
+        message_surface = app._text_surface("regular", message, text_color)
         message_rect = message_surface.get_rect()
         message_rect.midtop = (width // 2, panel_top + 8)
         message_rect.clamp_ip(pygame.Rect(0, panel_top, width, panel_height))
@@ -112,24 +170,10 @@ def draw_ui(app) -> None:
 
     stats_top = max(base_stats_top, message_bottom + 12)
 
-    instruction_parts = [
-        "P1: A/D move, W/S aim, Space fire, Q/E power",
-    ]
-    if getattr(app, "ai_opponent_active", False):
-        instruction_parts.append("P2: Computer controlled opponent")
-    else:
-        instruction_parts.append("P2: ←/→ move, ↑/↓ aim, Enter fire, [,/.] power")
-    instruction_parts.extend(
-        [
-            "Superpowers: B bomber, N squad, M scope",
-            "Hold Shift: coarse aim & power",
-            "Esc: pause menu",
-        ]
+    instructions_text = _instructions_text(
+        bool(getattr(app, "ai_opponent_active", False)), bool(app.cheat_enabled)
     )
-    if app.cheat_enabled:
-        instruction_parts.append("F1: cheat console")
-    instructions_text = "   |   ".join(instruction_parts)
-    instructions_surface = app.font_small.render(instructions_text, True, text_muted)
+    instructions_surface = app._text_surface("small", instructions_text, text_muted)
     instructions_rect = instructions_surface.get_rect(centerx=width // 2)
     default_instructions_top = panel_top + panel_height - instructions_surface.get_height() - 6
     instructions_rect.top = default_instructions_top
@@ -152,7 +196,7 @@ def draw_ui(app) -> None:
         available_width = max(1, inner_right - inner_left)
         dial_radius = clamp(available_width / 6, 18, 28)
         dial_radius = int(dial_radius)
-        name_surface = app.font_regular.render(tank.name, True, text_color)
+        name_surface = app._text_surface("regular", tank.name, text_color)
         name_y = stats_top
         if idx == 0:
             name_x = inner_left
@@ -163,7 +207,7 @@ def draw_ui(app) -> None:
         match_scores = getattr(app, "match_scores", [0] * len(tanks))
         wins_value = match_scores[idx] if idx < len(match_scores) else 0
         wins_text = f"Wins: {wins_value}"
-        score_surface = app.font_small.render(wins_text, True, text_muted)
+        score_surface = app._text_surface("small", wins_text, text_muted)
         if idx == 0:
             score_x = inner_left
         else:
@@ -237,11 +281,11 @@ def draw_ui(app) -> None:
 
         max_hp = getattr(tank, "max_hp", 100)
         health_ratio = clamp(tank.hp / max_hp if max_hp else 0)
-        health_color = pygame.Color(210, 80, 80)
+        health_color = _HEALTH_LOW
         if tank.hp > max_hp * 0.6:
-            health_color = pygame.Color(120, 200, 120)
+            health_color = _HEALTH_HIGH
         elif tank.hp > max_hp * 0.3:
-            health_color = pygame.Color(230, 180, 90)
+            health_color = _HEALTH_MID
         draw_progress_bar(
             bar_rects[0],
             health_ratio,
@@ -252,7 +296,7 @@ def draw_ui(app) -> None:
 
         power_range = max(0.001, tank.max_power - tank.min_power)
         power_ratio = clamp((tank.shot_power - tank.min_power) / power_range)
-        power_color = pygame.Color(90, 160, 230)
+        power_color = _POWER_COLOR
         draw_progress_bar(
             bar_rects[1],
             power_ratio,
@@ -263,7 +307,7 @@ def draw_ui(app) -> None:
 
         super_ratio = clamp(tank.super_power)
         super_ready = super_ratio >= 1.0 - 1e-3
-        super_color = pygame.Color(240, 200, 90) if super_ready else pygame.Color(200, 120, 230)
+        super_color = _SUPER_READY if super_ready else _SUPER_CHARGING
         super_value = "Ready (B/N/M)" if super_ready else f"{int(super_ratio * 100):02d}%"
         draw_progress_bar(
             bar_rects[2],
@@ -277,9 +321,7 @@ def draw_ui(app) -> None:
     surface.blit(instructions_surface, instructions_rect)
 
     if app.cheat_enabled and app.cheat_menu_visible:
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        surface.blit(_translucent_overlay(surface.get_size(), (0, 0, 0, 180)), (0, 0))
         menu_lines = [
             "Cheat Console",
             "1 - Detonate Player 1",
@@ -288,32 +330,97 @@ def draw_ui(app) -> None:
             "F1 / Esc - Close",
         ]
         for idx, line in enumerate(menu_lines):
-            font = app.font_large if idx == 0 else app.font_regular
-            text_surface = font.render(line, True, pygame.Color("white"))
+            font_id = "large" if idx == 0 else "regular"
+            text_surface = app._text_surface(font_id, line, _WHITE)
             rect = text_surface.get_rect(
                 center=(surface.get_width() / 2, surface.get_height() / 2 + idx * 36)
             )
             surface.blit(text_surface, rect)
 
 
+def _menu_text_surfaces(app) -> tuple:
+    """Return the rendered title, message, option and footer text for the menu.
+
+    Menu text only changes when the controller swaps menus, rebuilds options
+    or updates its message, so the surfaces are cached against those inputs
+    and only re-rasterised when one of them differs.
+    """
+
+    menu = app.menu
+    footer_text = None
+    if app.state == "main_menu":
+        footer_text = "Esc exits the game"
+    elif app.state == "pause_menu":
+        footer_text = "Esc resumes"
+    elif app.state in {"settings_menu", "post_game_menu", "keybind_menu"}:
+        footer_text = "Esc returns to the start menu" if app.state != "keybind_menu" else "Esc returns to Settings"
+    key = (
+        menu.title,
+        menu.message,
+        tuple(option.label for option in menu.options),
+        footer_text,
+        app.font_small,
+        app.font_regular,
+        app.font_large,
+    )
+    cached = app._menu_text_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    title_lines = menu.title.splitlines() or [menu.title]
+    title_surfaces = [
+        app._text_surface("large", line, _WHITE)
+        for line in title_lines
+    ]
+    message_surface = None
+    if menu.message:
+        message_surface = app._text_surface(
+            "regular", menu.message, _MENU_MESSAGE
+        )
+    option_surfaces = [
+        (
+            app._text_surface("regular", option.label, _MENU_OPTION),
+            app._text_surface("regular", option.label, _WHITE),
+        )
+        for option in menu.options
+    ]
+    footer_surface = None
+    if footer_text:
+        footer_surface = app._text_surface("small", footer_text, _MENU_FOOTER)
+    surfaces = (title_surfaces, message_surface, option_surfaces, footer_surface)
+    app._menu_text_cache = (key, surfaces)
+    return surfaces
+
+
 def draw_menu_overlay(app) -> None:
     if app.state not in {"main_menu", "pause_menu", "post_game_menu", "settings_menu", "keybind_menu"}:
         return
     surface = app.screen
     alpha = 200 if app.state in {"main_menu", "settings_menu"} else 160
-    overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, alpha))
-    surface.blit(overlay, (0, 0))
+    surface.blit(_translucent_overlay(surface.get_size(), (0, 0, 0, alpha)), (0, 0))
+    surface.blits(_menu_layout(app, surface.get_size()), doreturn=False)
+
+
+def _menu_layout(app, size: tuple[int, int]) -> list[tuple[pygame.Surface, pygame.Rect]]:
+    """Return the menu's text and highlight blits, positioned for ``size``.
 
-    center_x = surface.get_width() // 2
-    center_y = surface.get_height() // 2
+    The layout only moves when the text, selection or screen size changes, so
+    steady menu frames reuse the previous sequence.
+    """
 
-    title_lines = app.menu.title.splitlines() or [app.menu.title]
+    text = _menu_text_surfaces(app)
+    key = (app.state, app.menu.selection, size, text)
+    cached = app._menu_layout_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    width, height = size
+    center_x = width // 2
+    center_y = height // 2
+    blit_seq: list[tuple[pygame.Surface, pygame.Rect]] = []
+
+    title_surfaces, message_surface, option_surfaces, footer_surface = text
     line_spacing = max(6, app.font_large.get_height() // 6)
-    title_surfaces = [
-        app.font_large.render(line, True, pygame.Color("white"))
-        for line in title_lines
-    ]
     total_height = sum(s.get_height() for s in title_surfaces)
     if len(title_surfaces) > 1:
         total_height += line_spacing * (len(title_surfaces) - 1)
@@ -324,55 +431,45 @@ def draw_menu_overlay(app) -> None:
         line_height = title_surface.get_height()
         line_center_y = current_top + line_height // 2
         title_rect = title_surface.get_rect(center=(center_x, line_center_y))
-        surface.blit(title_surface, title_rect)
+        blit_seq.append((title_surface, title_rect))
         title_bottom = title_rect.bottom
         current_top = title_rect.bottom + line_spacing
 
-    if app.menu.message:
-        message_surface = app.font_regular.render(
-            app.menu.message, True, pygame.Color(220, 220, 220)
-        )
+    if message_surface is not None:
         message_rect = message_surface.get_rect(center=(center_x, title_bottom + 36))
-        surface.blit(message_surface, message_rect)
+        blit_seq.append((message_surface, message_rect))
         options_start_y = message_rect.bottom + 24
     else:
         options_start_y = title_bottom + 32
 
     option_spacing = 40
-    option_font = app.font_regular
-    option_height = option_font.get_height()
+    option_height = app.font_regular.get_height()
     if app.state == "keybind_menu":
         option_spacing = max(option_height + 8, 28)
 
-    total_options_height = len(app.menu.options) * option_spacing
-    max_start = surface.get_height() - 80 - total_options_height
+    total_options_height = len(option_surfaces) * option_spacing
+    max_start = height - 80 - total_options_height
     options_start_y = min(options_start_y, max_start)
     options_start_y = max(options_start_y, title_bottom + 16)
 
-    for idx, option in enumerate(app.menu.options):
+    for idx, (idle_surface, selected_surface) in enumerate(option_surfaces):
         is_selected = idx == app.menu.selection
-        color = pygame.Color("white") if is_selected else pygame.Color(200, 200, 200)
-        text_surface = option_font.render(option.label, True, color)
+        text_surface = selected_surface if is_selected else idle_surface
         text_rect = text_surface.get_rect(center=(center_x, options_start_y + idx * option_spacing))
         if is_selected:
-            highlight = pygame.Surface((text_rect.width + 36, text_rect.height + 12), pygame.SRCALPHA)
-            highlight.fill((255, 255, 255, 50))
+            highlight = _translucent_overlay(
+                (text_rect.width + 36, text_rect.height + 12), (255, 255, 255, 50)
+            )
             highlight_rect = highlight.get_rect(center=text_rect.center)
-            surface.blit(highlight, highlight_rect)
-        surface.blit(text_surface, text_rect)
+            blit_seq.append((highlight, highlight_rect))
+        blit_seq.append((text_surface, text_rect))
 
-    footer_text = None
-    if app.state == "main_menu":
-        footer_text = "Esc exits the game"
-    elif app.state == "pause_menu":
-        footer_text = "Esc resumes"
-    elif app.state in {"settings_menu", "post_game_menu", "keybind_menu"}:
-        footer_text = "Esc returns to the start menu" if app.state != "keybind_menu" else "Esc returns to Settings"
+    if footer_surface is not None:
+        footer_rect = footer_surface.get_rect(center=(center_x, height - 36))
+        blit_seq.append((footer_surface, footer_rect))
 
-    if footer_text:
-        footer_surface = app.font_small.render(footer_text, True, pygame.Color(180, 180, 180))
-        footer_rect = footer_surface.get_rect(center=(center_x, surface.get_height() - 36))
-        surface.blit(footer_surface, footer_rect)
+    app._menu_layout_cache = (key, blit_seq)
+    return blit_seq
 
 
 __all__ = ["draw_ui", "draw_menu_overlay"]
@@ -4,28 +4,38 @@ from __future__ import annotations
 
 import math
 import random
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 import pygame
 import pygame.gfxdraw
 
 from tanx_game.core.game import Game
 from tanx_game.core.tank import Tank
-def _scale_color(color: pygame.Color, factor: float) -> pygame.Color:
+_ColorLike = Union[pygame.Color, Tuple[int, int, int]]
+
+# Longest stretch of height samples merged into one terrain polygon run.
+_TERRAIN_RUN_BLOCK = 24
+
+# Distinct animation frames an explosion fireball is quantised to.
+_EXPLOSION_STEPS = 16
+
+
+def _scale_color(color: _ColorLike, factor: float) -> pygame.Color:
     return pygame.Color(
-        max(0, min(255, int(color.r * factor))),
-        max(0, min(255, int(color.g * factor))),
-        max(0, min(255, int(color.b * factor))),
+        max(0, min(255, int(color[0] * factor))),
+        max(0, min(255, int(color[1] * factor))),
+        max(0, min(255, int(color[2] * factor))),
     )
 
 
-def _blend_color(color: pygame.Color, other: pygame.Color, ratio: float) -> pygame.Color:
+def _blend_color(color: _ColorLike, other: _ColorLike, ratio: float) -> pygame.Color:
     clamped = max(0.0, min(1.0, ratio))
     inv = 1.0 - clamped
     return pygame.Color(
-        int(color.r * inv + other.r * clamped),
-        int(color.g * inv + other.g * clamped),
-        int(color.b * inv + other.b * clamped),
+        int(color[0] * inv + other[0] * clamped),
+        int(color[1] * inv + other[1] * clamped),
+        int(color[2] * inv + other[2] * clamped),
     )
 
 
@@ -141,6 +151,44 @@ def draw_aim_indicator(app) -> None:
         pygame.draw.circle(surface, pygame.Color(60, 40, 20), (screen_x, screen_y), marker_radius, 2)
 
 
+def _sky_gradient(app, width: int, height: int) -> pygame.Surface:
+    """Build the sky as a one-pixel column and stretch it across ``width``.
+
+    The column bytes come from a single comprehension and the horizontal
+    fan-out is a nearest-neighbour scale in C.
+    """
+
+    top = app.sky_color_top[:3]
+    bottom = app.sky_color_bottom[:3]
+    span = max(height - 1, 1)
+    mixes = [y / span for y in range(height)]
+    column = bytes(
+        int(t * (1 - mix) + b * mix)
+        for mix in mixes
+        for t, b in zip(top, bottom)
+    )
+    strip = pygame.image.frombytes(column, (1, height), "RGB")
+    return pygame.transform.scale(strip, (width, height))
+
+
+def _draw_distant_hills(app, surface: pygame.Surface, world_width_px: int, height: int) -> None:
+    """Draw the classic map's distant hill silhouette with its parallax offset."""
+
+    playfield_left = app.playfield_offset_x
+    playfield_right = playfield_left + world_width_px
+    hill_points = []
+    origin_x, origin_y = _playfield_origin(app, parallax=0.15)
+    base_line = origin_y + int(world_width_px * 0.08)
+    for x_world, elevation in app._distant_hills:
+        x = origin_x + int(round(x_world * app.cell_size))
+        y = base_line - int(round(elevation * app.cell_size * 0.3))
+        hill_points.append((x, y))
+    if hill_points:
+        hill_points.append((playfield_right + _camera_offset_px(app, 0.15)[0], height))
+        hill_points.append((playfield_left + _camera_offset_px(app, 0.15)[0], height))
+        pygame.draw.polygon(surface, pygame.Color(62, 94, 82), hill_points)
+
+
 def draw_background(app) -> None:
     surface = app.screen
     width = surface.get_width()
@@ -148,36 +196,46 @@ def draw_background(app) -> None:
     style = app.terrain_style
     cam_x, cam_y = app.camera_offset
 
-    sky_top = app.sky_color_top
-    sky_bottom = app.sky_color_bottom
-    gradient_shift = cam_y * 0.25
-    for y in range(height):
-        mix = (y + gradient_shift) / max(height - 1, 1)
-        mix = max(0.0, min(1.0, mix))
-        color = pygame.Color(
-            int(sky_top.r * (1 - mix) + sky_bottom.r * mix),
-            int(sky_top.g * (1 - mix) + sky_bottom.g * mix),
-            int(sky_top.b * (1 - mix) + sky_bottom.b * mix),
-        )
-        surface.fill(color, pygame.Rect(0, y, width, 1))
+    key = (width, height, app.sky_color_top, app.sky_color_bottom)
+    if app._sky_cache_key != key:
+        app._sky_cache = _sky_gradient(app, width, height).convert()
+        app._sky_cache_key = key
 
     world_width_px = app.world_width * app.cell_size
     playfield_left = app.playfield_offset_x
-    playfield_right = playfield_left + world_width_px
-
-    # Distant hills for the classic map style
-    if style == "classic" and app._distant_hills:
-        hill_points = []
-        origin_x, origin_y = _playfield_origin(app, parallax=0.15)
-        base_line = origin_y + int(world_width_px * 0.08)
-        for x_world, elevation in app._distant_hills:
-            x = origin_x + int(round(x_world * app.cell_size))
-            y = base_line - int(round(elevation * app.cell_size * 0.3))
-            hill_points.append((x, y))
-        if hill_points:
-            hill_points.append((playfield_right + _camera_offset_px(app, 0.15)[0], height))
-            hill_points.append((playfield_left + _camera_offset_px(app, 0.15)[0], height))
-            pygame.draw.polygon(surface, pygame.Color(62, 94, 82), hill_points)
+    draw_hills = style == "classic" and bool(app._distant_hills)
+
+    if _camera_offset_px(app) == (0, 0):
+        # With the camera at rest the sky and distant hills never change, so
+        # they are composited once and presented with a single blit.
+        backdrop_key = (
+            key,
+            draw_hills,
+            app._distant_hills,
+            app.cell_size,
+            playfield_left,
+            app.ui_height,
+            world_width_px,
+        )
+        if app._backdrop_cache_key != backdrop_key:
+            backdrop = app._sky_cache.copy()
+            if draw_hills:
+                _draw_distant_hills(app, backdrop, world_width_px, height)
+            app._backdrop_cache = backdrop
+            app._backdrop_cache_key = backdrop_key
+        surface.blit(app._backdrop_cache, (0, 0))
+    else:
+        # Camera shake nudges the gradient by at most a couple of rows; slide
+        # the cached sky instead of rebuilding it and pad the exposed edge
+        # with the clamped end colour, as the per-row formula would.
+        shift_px = int(round(cam_y * 0.25))
+        surface.blit(app._sky_cache, (0, -shift_px))
+        if shift_px > 0:
+            surface.fill(app.sky_color_bottom, pygame.Rect(0, height - shift_px, width, shift_px))
+        elif shift_px < 0:
+            surface.fill(app.sky_color_top, pygame.Rect(0, 0, width, -shift_px))
+        if draw_hills:
+            _draw_distant_hills(app, surface, world_width_px, height)
 
     # Skyline silhouettes (primarily for urban maps)
     skyline = getattr(app, "_skyline_shapes", [])
@@ -227,11 +285,78 @@ def draw_background(app) -> None:
 
 
 def draw_world(app) -> None:
-    game: Game = app.logic
-    world = game.world
-    detail = world.detail
-    surface = app.screen
+    world = app.logic.world
     cell = app.cell_size
+    texture = getattr(app, "terrain_texture", None)
+    cache_key = (world, world.terrain_revision, cell, texture)
+    if app._terrain_cache_key != cache_key:
+        dirty = None
+        previous = app._terrain_cache_key
+        if (
+            previous is not None
+            and previous[0] is world
+            and previous[2:] == cache_key[2:]
+            and app._terrain_surface is not None
+        ):
+            dirty = _changed_height_span(app._terrain_baked_heights, world.height_map)
+        if dirty != ():
+            app._terrain_outline = _bake_terrain(app, world, cell, texture, dirty)
+            app._terrain_baked_heights = list(world.height_map)
+        app._terrain_cache_key = cache_key
+        app._terrain_outline_origin = None
+    if app._terrain_surface is None or not app._terrain_outline:
+        return
+
+    surface = app.screen
+    origin = _playfield_origin(app)
+    surface.blit(app._terrain_surface, origin)
+
+    # The rim only moves with the camera, so the screen-space points are kept
+    # until the terrain is rebaked or the origin shifts.
+    if app._terrain_outline_origin != origin:
+        offset_x, offset_y = origin
+        app._terrain_outline_screen = [
+            (offset_x + x, offset_y + y) for x, y in app._terrain_outline
+        ]
+        app._terrain_outline_origin = origin
+    pygame.draw.aalines(
+        surface, app.crater_rim_color, False, app._terrain_outline_screen, blend=1
+    )
+
+
+def _changed_height_span(
+    baked: List[float], current: List[float]
+) -> Optional[Tuple[int, ...]]:
+    """Return the ``(first, last)`` changed height samples since the last bake.
+
+    An empty tuple means nothing changed; ``None`` asks for a full rebake.
+    """
+
+    if len(baked) != len(current):
+        return None
+    changed = [idx for idx, (old, new) in enumerate(zip(baked, current)) if old != new]
+    if not changed:
+        return ()
+    return changed[0], changed[-1]
+
+
+def _bake_terrain(
+    app,
+    world,
+    cell: int,
+    texture: Optional[pygame.Surface],
+    dirty: Optional[Tuple[int, int]] = None,
+) -> List[tuple[int, int]]:
+    """Render the shaded terrain into ``app._terrain_surface``.
+
+    ``dirty`` limits the work to the columns around a ``(first, last)`` span of
+    changed height samples, such as a fresh crater; only that strip of the
+    cached surface is repainted. Returns the unscaled surface outline so
+    :func:`draw_world` can stroke the rim every frame without rebuilding the
+    polygons.
+    """
+
+    detail = world.detail
     width_px = world.width * cell
     height_px = world.height * cell
     scale_factor = 2
@@ -239,11 +364,8 @@ def draw_world(app) -> None:
     hi_size = (width_px * scale_factor, height_px * scale_factor)
     if app._terrain_hi_surface is None or app._terrain_hi_surface.get_size() != hi_size:
         app._terrain_hi_surface = pygame.Surface(hi_size, pygame.SRCALPHA)
-    if app._terrain_surface is None or app._terrain_surface.get_size() != (width_px, height_px):
-        app._terrain_surface = pygame.Surface((width_px, height_px), pygame.SRCALPHA)
 
     hi_surface = app._terrain_hi_surface
-    hi_surface.fill((0, 0, 0, 0))
 
     surface_points_hi: List[tuple[int, int]] = []
     surface_points: List[tuple[int, int]] = []
@@ -264,7 +386,8 @@ def draw_world(app) -> None:
         )
 
     if not surface_points_hi:
-        return
+        hi_surface.fill((0, 0, 0, 0))
+        return []
 
     light = pygame.math.Vector2(-0.35, -1.0)
     if light.length_squared() > 0:
@@ -284,14 +407,21 @@ def draw_world(app) -> None:
             255,
         )
 
+    # Group consecutive segments that share a shade into runs so each run is
+    # filled as one polygon per layer instead of one per height sample. Flat
+    # and evenly sloped stretches collapse to a handful of gfxdraw calls.
+    # Runs never cross a _TERRAIN_RUN_BLOCK boundary, which keeps a crater's
+    # influence on the segmentation local for partial rebakes.
+    runs: List[Tuple[float, List[tuple[int, int]]]] = []
+    last_index = len(world.height_map) - 1
+    dx = 1.0 / detail
     for idx in range(len(surface_points_hi) - 1):
         x0, y0 = surface_points_hi[idx]
         x1, y1 = surface_points_hi[idx + 1]
         if x0 == x1:
             continue
         h0 = world.height_map[idx]
-        h1 = world.height_map[min(idx + 1, len(world.height_map) - 1)]
-        dx = 1.0 / detail
+        h1 = world.height_map[min(idx + 1, last_index)]
         dy = h1 - h0
         tangent = pygame.math.Vector2(dx, dy)
         if tangent.length_squared() == 0:
@@ -302,26 +432,63 @@ def draw_world(app) -> None:
         normal = normal.normalize()
         shade_factor = 0.35 + 0.65 * max(0.0, normal.dot(light))
 
-        rock_poly = [(x0, y0), (x1, y1), (x1, bottom_hi), (x0, bottom_hi)]
+        if (
+            runs
+            and idx % _TERRAIN_RUN_BLOCK
+            and runs[-1][0] == shade_factor
+            and runs[-1][1][-1] == (x0, y0)
+        ):
+            runs[-1][1].append((x1, y1))
+        else:
+            runs.append((shade_factor, [(x0, y0), (x1, y1)]))
+
+    if dirty is None:
+        region = pygame.Rect(0, 0, width_px, height_px)
+    else:
+        # Repaint every run touching the segments either side of the changed
+        # samples (a run's polygons depend on its whole extent), plus a few
+        # pixels for antialiased edges, on even columns so the 2:1
+        # smoothscale windows line up with a full bake.
+        first, last = dirty
+        changed_left = surface_points_hi[max(0, first - 1)][0]
+        changed_right = surface_points_hi[min(len(surface_points_hi) - 1, last + 1)][0]
+        span_left, span_right = changed_left, changed_right
+        for _, top in runs:
+            if top[-1][0] >= changed_left and top[0][0] <= changed_right:
+                span_left = min(span_left, top[0][0])
+                span_right = max(span_right, top[-1][0])
+        left = max(0, (span_left // scale_factor - 4) & ~1)
+        right = min(width_px, span_right // scale_factor + 5)
+        region = pygame.Rect(left, 0, max(0, right - left), height_px)
+    hi_region = pygame.Rect(
+        region.x * scale_factor,
+        0,
+        region.width * scale_factor,
+        height_px * scale_factor,
+    )
+    # No clip rect here: SDL_gfx re-rasterises clipped antialiased edges, which
+    # would leave seams. Strokes spilling outside the region are never read.
+    hi_surface.fill((0, 0, 0, 0), hi_region)
+
+    for shade_factor, top in runs:
+        left_x = top[0][0]
+        right_x = top[-1][0]
+        if right_x < hi_region.left - 4 or left_x > hi_region.right + 4:
+            continue
+        rock_poly = top + [(right_x, bottom_hi), (left_x, bottom_hi)]
         rock_col = shade(rock_color, shade_factor)
         pygame.gfxdraw.filled_polygon(hi_surface, rock_poly, rock_col)
         pygame.gfxdraw.aapolygon(hi_surface, rock_poly, rock_col)
 
-        soil_poly = [
-            (x0, y0),
-            (x1, y1),
-            (x1, min(bottom_hi, y1 + soil_thickness_hi)),
-            (x0, min(bottom_hi, y0 + soil_thickness_hi)),
+        soil_poly = top + [
+            (x, min(bottom_hi, y + soil_thickness_hi)) for x, y in reversed(top)
         ]
         soil_col = shade(soil_color, shade_factor)
         pygame.gfxdraw.filled_polygon(hi_surface, soil_poly, soil_col)
         pygame.gfxdraw.aapolygon(hi_surface, soil_poly, soil_col)
 
-        grass_poly = [
-            (x0, y0),
-            (x1, y1),
-            (x1, min(bottom_hi, y1 + grass_thickness_hi)),
-            (x0, min(bottom_hi, y0 + grass_thickness_hi)),
+        grass_poly = top + [
+            (x, min(bottom_hi, y + grass_thickness_hi)) for x, y in reversed(top)
         ]
         grass_col = shade(grass_color, shade_factor)
         pygame.gfxdraw.filled_polygon(hi_surface, grass_poly, grass_col)
@@ -329,22 +496,22 @@ def draw_world(app) -> None:
 
     pygame.draw.aalines(hi_surface, app.crater_rim_color, False, surface_points_hi, blend=1)
 
-    terrain_surface = pygame.transform.smoothscale(hi_surface, (width_px, height_px))
-    app._terrain_surface = terrain_surface
-    texture = getattr(app, "terrain_texture", None)
+    if region.width <= 0:
+        return surface_points
+    patch = pygame.transform.smoothscale(hi_surface.subsurface(hi_region), region.size)
     if texture is not None:
         tex_w, tex_h = texture.get_size()
-        for x in range(0, width_px, tex_w):
+        for x in range(region.left - region.left % tex_w, region.right, tex_w):
             for y in range(0, height_px, tex_h):
-                terrain_surface.blit(texture, (x, y), special_flags=pygame.BLEND_MULT)
-
-    offset_x, offset_y = _playfield_origin(app)
-    surface.blit(terrain_surface, (offset_x, offset_y))
-
-    outline_points = [
-        (offset_x + x, offset_y + y) for x, y in surface_points
-    ]
-    pygame.draw.aalines(surface, app.crater_rim_color, False, outline_points, blend=1)
+                patch.blit(texture, (x - region.left, y), special_flags=pygame.BLEND_MULT)
+    if dirty is None:
+        # Match the display format once so the per-frame blit takes SDL's fast path.
+        app._terrain_surface = patch.convert_alpha()
+    else:
+        # Replace the strip outright: clear it, then add the patch onto zeros.
+        app._terrain_surface.fill((0, 0, 0, 0), region)
+        app._terrain_surface.blit(patch, region, special_flags=pygame.BLEND_RGBA_ADD)
+    return surface_points
 
 
 def draw_rubble(app) -> None:
@@ -407,6 +574,82 @@ def draw_rubble(app) -> None:
             pygame.draw.rect(surface, highlight, highlight_rect, 1)
 
 
+@lru_cache(maxsize=256)
+def _rubble_lines(
+    seed: int, left: int, top: int, width: int, height: int, cell: int
+) -> Tuple[Tuple[Tuple[int, int], Tuple[int, int]], ...]:
+    """Return the debris strokes for a destroyed floor occupying the given rect.
+
+    The strokes are seeded per floor, so they are computed once per floor
+    rect instead of re-running the RNG every frame.
+    """
+
+    rng = random.Random(seed)
+    right = left + width
+    bottom = top + height
+    rows = max(2, height // max(6, int(cell * 0.45)))
+    lines = []
+    for row in range(rows):
+        y = bottom - 1 - row * max(3, height // (rows + 4))
+        if y <= top:
+            break
+        x_start = left + rng.randint(0, max(1, width // 6))
+        x_end = right - rng.randint(0, max(1, width // 6))
+        lines.append(((x_start, y), (x_end, y)))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=256)
+def _crack_lines(
+    seed: int, left: int, top: int, width: int, height: int, cell: int
+) -> Tuple[Tuple[Tuple[int, int], Tuple[int, int]], ...]:
+    """Return the seeded crack strokes for a damaged floor occupying the given rect."""
+
+    rng = random.Random(seed)
+    right = left + width
+    bottom = top + height
+    lines = []
+    for _ in range(max(2, width // max(18, int(cell)))):
+        start_x = rng.randint(left + 2, right - 2)
+        start_y = rng.randint(top + 2, bottom - 4)
+        end_x = start_x + rng.randint(-width // 4, width // 4)
+        end_y = start_y + rng.randint(4, height // 2)
+        lines.append(
+            ((start_x, start_y), (max(left + 1, min(right - 1, end_x)), min(bottom - 1, end_y)))
+        )
+    return tuple(lines)
+
+
+@lru_cache(maxsize=64)
+def _window_grid(
+    cols: int,
+    rows: int,
+    window_w: int,
+    window_h: int,
+    glass_color: Tuple[int, int, int],
+    sill_color: Tuple[int, int, int],
+) -> pygame.Surface:
+    """Return a colour-keyed sprite holding a floor's grid of windows and sills.
+
+    Floors redraw the same grid every frame, so the per-window rect and line
+    calls are replaced by a single blit of this cached sprite.
+    """
+
+    key = (255, 0, 255)
+    while key in (glass_color, sill_color):
+        key = (key[0], key[1] + 1, key[2])
+    grid = pygame.Surface((cols * (window_w + 3) - 2, rows * (window_h + 3) - 2))
+    grid.fill(key)
+    window_rect = pygame.Rect(0, 0, window_w, window_h)
+    for row in range(rows):
+        for col in range(cols):
+            window_rect.topleft = (col * (window_w + 3), row * (window_h + 3))
+            pygame.draw.rect(grid, glass_color, window_rect)
+            pygame.draw.line(grid, sill_color, window_rect.bottomleft, window_rect.bottomright, 1)
+    grid.set_colorkey(key, pygame.RLEACCEL)
+    return grid.convert()
+
+
 def draw_buildings(app) -> None:
     world = app.logic.world
     buildings = getattr(world, "buildings", None)
@@ -474,15 +717,11 @@ def draw_buildings(app) -> None:
             pygame.draw.rect(surface, fill_color, rect)
 
             if floor.destroyed:
-                rubble_rng = random.Random((building.id << 8) + idx)
-                debris_rows = max(2, rect.height // max(6, int(cell * 0.45)))
-                for row in range(debris_rows):
-                    y = rect.bottom - 1 - row * max(3, rect.height // (debris_rows + 4))
-                    if y <= rect.top:
-                        break
-                    x_start = rect.left + rubble_rng.randint(0, max(1, rect.width // 6))
-                    x_end = rect.right - rubble_rng.randint(0, max(1, rect.width // 6))
-                    pygame.draw.line(surface, _blend_color(rubble_color, pygame.Color(90, 72, 60), 0.3), (x_start, y), (x_end, y), 2)
+                debris_color = _blend_color(rubble_color, pygame.Color(90, 72, 60), 0.3)
+                for start, end in _rubble_lines(
+                    (building.id << 8) + idx, rect.left, rect.top, rect.width, rect.height, cell
+                ):
+                    pygame.draw.line(surface, debris_color, start, end, 2)
             elif rect.width > 10 and rect.height > 10:
                 window_cols = max(1, rect.width // max(7, int(cell * 0.75)))
                 window_rows = max(1, rect.height // max(12, int(cell * 1.1)))
@@ -490,24 +729,24 @@ def draw_buildings(app) -> None:
                 window_h = max(3, (rect.height - (window_rows + 1) * 3) // window_rows)
                 glass_color = _blend_color(fill_color, pygame.Color(220, 230, 240), 0.65)
                 sill_color = _blend_color(fill_color, pygame.Color(40, 40, 40), 0.55)
-                for row in range(window_rows):
-                    for col in range(window_cols):
-                        wx = rect.left + 3 + col * (window_w + 3)
-                        wy = rect.top + 3 + row * (window_h + 3)
-                        window_rect = pygame.Rect(wx, wy, window_w, window_h)
-                        pygame.draw.rect(surface, glass_color, window_rect)
-                        pygame.draw.line(surface, sill_color, window_rect.bottomleft, window_rect.bottomright, 1)
+                surface.blit(
+                    _window_grid(
+                        window_cols,
+                        window_rows,
+                        window_w,
+                        window_h,
+                        tuple(glass_color)[:3],
+                        tuple(sill_color)[:3],
+                    ),
+                    (rect.left + 3, rect.top + 3),
+                )
 
                 if integrity < 0.65:
-                    crack_rng = random.Random((building.id << 6) ^ idx)
-                    crack_count = max(2, rect.width // max(18, int(cell)))
                     crack_color = _blend_color(pygame.Color(30, 24, 20), fill_color, 0.4)
-                    for _ in range(crack_count):
-                        start_x = crack_rng.randint(rect.left + 2, rect.right - 2)
-                        start_y = crack_rng.randint(rect.top + 2, rect.bottom - 4)
-                        end_x = start_x + crack_rng.randint(-rect.width // 4, rect.width // 4)
-                        end_y = start_y + crack_rng.randint(4, rect.height // 2)
-                        pygame.draw.line(surface, crack_color, (start_x, start_y), (max(rect.left + 1, min(rect.right - 1, end_x)), min(rect.bottom - 1, end_y)), 1)
+                    for start, end in _crack_lines(
+                        (building.id << 6) ^ idx, rect.left, rect.top, rect.width, rect.height, cell
+                    ):
+                        pygame.draw.line(surface, crack_color, start, end, 1)
 
             border_color = _blend_color(fill_color, pygame.Color(24, 24, 28), 0.6)
             pygame.draw.rect(surface, border_color, rect, 1)
@@ -529,6 +768,33 @@ def draw_buildings(app) -> None:
             pygame.draw.line(surface, _blend_color(roof_color, pygame.Color(18, 18, 26), 0.6), roof_rect.topleft, roof_rect.topright, 1)
 
 
+@lru_cache(maxsize=16)
+def _tank_palette(base_color: Tuple[int, int, int]) -> Tuple[pygame.Color, ...]:
+    """Return the shaded hull, track, turret and detail colours for a tank."""
+
+    steel = pygame.Color(180, 190, 204)
+    track_color = _scale_color(base_color, 0.45)
+    turret_color = _scale_color(base_color, 1.05)
+    return (
+        _scale_color(base_color, 1.0),
+        _scale_color(base_color, 1.18),
+        _scale_color(base_color, 0.75),
+        track_color,
+        _blend_color(track_color, steel, 0.3),
+        turret_color,
+        _scale_color(base_color, 0.8),
+        _blend_color(turret_color, steel, 0.25),
+        _scale_color(turret_color, 0.6),
+        _scale_color(base_color, 0.7),
+    )
+
+
+@lru_cache(maxsize=512)
+def _barrel_direction(turret_angle: float, facing: int) -> Tuple[float, float]:
+    angle = math.radians(turret_angle)
+    return math.cos(angle) * facing, -math.sin(angle)
+
+
 def draw_tanks(app) -> None:
     surface = app.screen
     offset_x, offset_y = _playfield_origin(app)
@@ -547,14 +813,18 @@ def draw_tanks(app) -> None:
         if not tank.alive:
             continue
 
-        base_color = app.tank_colors[idx % len(app.tank_colors)]
-        hull_color = _scale_color(base_color, 1.0)
-        hull_highlight = _scale_color(base_color, 1.18)
-        hull_shadow = _scale_color(base_color, 0.75)
-        track_color = _scale_color(base_color, 0.45)
-        wheel_color = _blend_color(track_color, steel, 0.3)
-        turret_color = _scale_color(base_color, 1.05)
-        turret_shadow = _scale_color(base_color, 0.8)
+        (
+            hull_color,
+            hull_highlight,
+            hull_shadow,
+            track_color,
+            wheel_color,
+            turret_color,
+            turret_shadow,
+            hatch_color,
+            hatch_inner_color,
+            rivet_color,
+        ) = _tank_palette(app.tank_colors[idx % len(app.tank_colors)])
 
         x = offset_x + tank.x * cell
         ground = app.logic.world.ground_height(tank.x + 0.5)
@@ -615,9 +885,7 @@ def draw_tanks(app) -> None:
         )
 
         # Barrel ------------------------------------------------------------------
-        angle = math.radians(tank.turret_angle)
-        dir_x = math.cos(angle) * facing
-        dir_y = -math.sin(angle)
+        dir_x, dir_y = _barrel_direction(tank.turret_angle, facing)
         pivot = (
             turret_center_x + dir_y * (barrel_width * 0.15),
             turret_center_y - dir_x * (barrel_width * 0.15),
@@ -644,7 +912,7 @@ def draw_tanks(app) -> None:
         hatch_radius = turret_radius * 0.45
         pygame.draw.circle(
             surface,
-            _blend_color(turret_color, steel, 0.25),
+            hatch_color,
             (
                 int(turret_center_x + facing * cell * 0.05),
                 int(turret_center_y - cell * 0.08),
@@ -653,7 +921,7 @@ def draw_tanks(app) -> None:
         )
         pygame.draw.circle(
             surface,
-            _scale_color(turret_color, 0.6),
+            hatch_inner_color,
             (
                 int(turret_center_x + facing * cell * 0.05),
                 int(turret_center_y - cell * 0.08),
@@ -666,12 +934,12 @@ def draw_tanks(app) -> None:
         for i in range(3):
             rivet_x = hull_rect.left + hull_rect.width * (0.2 + 0.3 * i)
             rivet_y = hull_rect.top + hull_rect.height * 0.32
-            pygame.draw.circle(surface, _scale_color(base_color, 0.7), (int(rivet_x), int(rivet_y)), rivet_radius)
+            pygame.draw.circle(surface, rivet_color, (int(rivet_x), int(rivet_y)), rivet_radius)
 
         if recoil_progress > 0.0:
             flash_radius = max(2, int(cell * 0.18 * recoil_progress))
             flash_color = pygame.Color(255, 220, 120, int(200 * recoil_progress))
-            angle_vec = pygame.math.Vector2(math.cos(angle) * facing, -math.sin(angle))
+            angle_vec = pygame.math.Vector2(dir_x, dir_y)
             tip = pygame.math.Vector2(end_x, end_y) + angle_vec * cell * 0.12
             pygame.draw.circle(surface, flash_color, (int(tip.x), int(tip.y)), flash_radius)
 
@@ -689,26 +957,34 @@ def draw_projectile(app, position: tuple[float, float]) -> None:
     )
 
 
+@lru_cache(maxsize=256)
+def _trail_blob(radius: int, alpha: int) -> pygame.Surface:
+    blob = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(
+        blob,
+        (255, 240, 150, alpha),
+        (radius, radius),
+        radius,
+    )
+    return blob.convert_alpha()
+
+
 def draw_trails(app) -> None:
     if not app.effects.trail_particles:
         return
     surface = app.screen
     offset_x, offset_y = _playfield_origin(app)
     duration = app.effects.trail_duration
+    cell = app.cell_size
+    blit_seq = []
     for (x, y), timer in app.effects.trail_particles:
         intensity = max(0.0, min(timer / duration, 1.0))
-        radius = max(2, int(app.cell_size * 0.25 * intensity + 1))
+        radius = max(2, int(cell * 0.25 * intensity + 1))
         alpha = int(180 * intensity)
-        blob = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(
-            blob,
-            (255, 240, 150, alpha),
-            (radius, radius),
-            radius,
-        )
-        screen_x = offset_x + x * app.cell_size - radius
-        screen_y = y * app.cell_size + offset_y - radius
-        surface.blit(blob, (screen_x, screen_y))
+        screen_x = offset_x + x * cell - radius
+        screen_y = y * cell + offset_y - radius
+        blit_seq.append((_trail_blob(radius, alpha), (screen_x, screen_y)))
+    surface.blits(blit_seq, doreturn=False)
 
 
 def draw_particles(app) -> None:
@@ -716,15 +992,16 @@ def draw_particles(app) -> None:
         return
     surface = app.screen
     offset_x, offset_y = _playfield_origin(app)
+    cell = app.cell_size
+    circle = pygame.draw.circle
     for particle in app.effects.particles:
         alpha = max(0, min(255, int(255 * (particle.life / particle.max_life))))
         if alpha <= 0:
             continue
-        color = pygame.Color(*particle.color, alpha)
-        px = int(offset_x + particle.x * app.cell_size)
-        py = int(particle.y * app.cell_size + offset_y)
+        px = int(offset_x + particle.x * cell)
+        py = int(particle.y * cell + offset_y)
         radius = max(1, int(particle.radius))
-        pygame.draw.circle(surface, color, (px, py), radius)
+        circle(surface, (*particle.color, alpha), (px, py), radius)
 
 
 def draw_debris(app) -> None:
@@ -732,6 +1009,7 @@ def draw_debris(app) -> None:
         return
     surface = app.screen
     offset_x, offset_y = _playfield_origin(app)
+    blit_seq = []
     for chunk in app.effects.debris:
         alpha = max(0, min(255, int(255 * (chunk.life / chunk.max_life))))
         if alpha <= 0:
@@ -744,7 +1022,8 @@ def draw_debris(app) -> None:
             offset_x + chunk.x * app.cell_size,
             chunk.y * app.cell_size + offset_y,
         )
-        surface.blit(rotated, rect)
+        blit_seq.append((rotated, rect))
+    surface.blits(blit_seq, doreturn=False)
 
 
 def draw_smoke(app) -> None:
@@ -753,16 +1032,16 @@ def draw_smoke(app) -> None:
     surface = app.screen
     offset_x, offset_y = _playfield_origin(app, parallax=0.98)
     cell = app.cell_size
+    circle = pygame.draw.circle
     for particle in app.effects.smoke:
         life_ratio = max(0.0, min(particle.life / particle.max_life, 1.0))
         alpha = int(160 * life_ratio)
         if alpha <= 8:
             continue
         radius_px = max(2, int(particle.radius * cell))
-        color = pygame.Color(*particle.color, alpha)
         px = int(offset_x + particle.x * cell)
         py = int(offset_y + particle.y * cell)
-        pygame.draw.circle(surface, color, (px, py), radius_px)
+        circle(surface, (*particle.color, alpha), (px, py), radius_px)
 
     if app.effects.embers:
         for ember in app.effects.embers:
@@ -770,11 +1049,28 @@ def draw_smoke(app) -> None:
             alpha = int(255 * life_ratio)
             if alpha <= 0:
                 continue
-            color = pygame.Color(*ember.color, alpha)
             px = int(offset_x + ember.x * cell)
             py = int(offset_y + ember.y * cell)
             radius = max(1, int(ember.radius * cell))
-            pygame.draw.circle(surface, color, (px, py), radius)
+            circle(surface, (*ember.color, alpha), (px, py), radius)
+
+
+@lru_cache(maxsize=128)
+def _explosion_sprite(size: int, radius: int, core_radius: int, alpha: int) -> pygame.Surface:
+    overlay = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(
+        overlay,
+        (255, 160, 64, alpha),
+        (radius, radius),
+        radius,
+    )
+    pygame.draw.circle(
+        overlay,
+        (255, 230, 120, 220),
+        (radius, radius),
+        core_radius,
+    )
+    return overlay.convert_alpha()
 
 
 def draw_explosions(app) -> None:
@@ -783,31 +1079,29 @@ def draw_explosions(app) -> None:
     surface = app.screen
     offset_x, offset_y = _playfield_origin(app)
     duration = app.effects.explosion_duration
+    blit_seq = []
     for (x, y), timer, scale in app.effects.explosions:
-        progress = 1 - min(max(timer / duration, 0.0), 1.0)
+        # Snap the animation to fixed steps so each frame of the fireball is
+        # rasterised once and reused by every explosion of the same scale.
+        elapsed = 1 - min(max(timer / duration, 0.0), 1.0)
+        progress = min(int(elapsed * _EXPLOSION_STEPS), _EXPLOSION_STEPS) / _EXPLOSION_STEPS
         radius = app.cell_size * (1.2 + progress * 1.3) * scale
         alpha = int(200 * (1 - progress))
-        overlay = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(
-            overlay,
-            (255, 160, 64, max(60, alpha)),
-            (int(radius), int(radius)),
+        overlay = _explosion_sprite(
+            int(radius * 2),
             int(radius),
-        )
-        pygame.draw.circle(
-            overlay,
-            (255, 230, 120, 220),
-            (int(radius), int(radius)),
             max(2, int(radius * 0.6)),
+            max(60, alpha),
         )
         screen_x = offset_x + x * app.cell_size - radius
         screen_y = y * app.cell_size + offset_y - radius
-        surface.blit(overlay, (screen_x, screen_y))
+        blit_seq.append((overlay, (screen_x, screen_y)))
+    surface.blits(blit_seq, doreturn=False)
 
 
 def draw_weather(app) -> None:
     effects = app.effects
-    if not effects.weather_drops:
+    if not effects.drop_x:
         return
     surface = app.screen
     weather = effects.weather_type
@@ -817,20 +1111,21 @@ def draw_weather(app) -> None:
     cell = app.cell_size
     if weather == "rain":
         color = pygame.Color(170, 190, 220, 170)
-        for drop in effects.weather_drops:
-            start_x = offset_x + drop.x * cell
-            start_y = offset_y + drop.y * cell
-            end_x = start_x - drop.vx * cell * 0.08
-            end_y = start_y - drop.vy * cell * 0.08
+        for x, y, vx, vy in zip(effects.drop_x, effects.drop_y, effects.drop_vx, effects.drop_vy):
+            start_x = offset_x + x * cell
+            start_y = offset_y + y * cell
+            end_x = start_x - vx * cell * 0.08
+            end_y = start_y - vy * cell * 0.08
             pygame.draw.line(surface, color, (start_x, start_y), (end_x, end_y), 1)
     else:  # snow
-        for drop in effects.weather_drops:
-            fade = max(0.2, min(1.0, 1.0 - drop.y / (app.world_height + 2.0)))
+        fade_span = app.world_height + 2.0
+        for x, y, length in zip(effects.drop_x, effects.drop_y, effects.drop_length):
+            fade = max(0.2, min(1.0, 1.0 - y / fade_span))
             alpha = int(220 * fade)
             color = pygame.Color(255, 255, 255, alpha)
-            radius = max(1, int(drop.length * cell * 0.6))
-            cx = int(offset_x + drop.x * cell)
-            cy = int(offset_y + drop.y * cell)
+            radius = max(1, int(length * cell * 0.6))
+            cx = int(offset_x + x * cell)
+            cy = int(offset_y + y * cell)
             pygame.draw.circle(surface, color, (cx, cy), radius)
 
 
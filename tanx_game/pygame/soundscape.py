@@ -2,18 +2,183 @@
 
 from __future__ import annotations
 
+import glob
 import math
 import os
 from array import array
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import pygame
 
+# Sine lookup table driven by a 16.16 fixed-point phase accumulator.
+_SINE_TABLE_BITS = 12
+_SINE_TABLE_SIZE = 1 << _SINE_TABLE_BITS
+_SINE_TABLE_MASK = _SINE_TABLE_SIZE - 1
+_PHASE_FRACTION_BITS = 16
+_SINE = array(
+    "d", [math.sin(2.0 * math.pi * i / _SINE_TABLE_SIZE) for i in range(_SINE_TABLE_SIZE)]
+)
+
+# Short placeholder partials stay below ~1 kHz, so they are synthesised near
+# this rate and linearly interpolated up to the mixer rate.
+_PLACEHOLDER_SYNTH_RATE = 11_025
+
+# Placeholder tone per category: (frequency, duration, amplitude, harmonics).
+_PlaceholderProfile = Tuple[float, float, float, Tuple[Tuple[float, float], ...]]
+
+_PLACEHOLDER_PROFILES: Dict[str, _PlaceholderProfile] = {
+    "ambient": (170.0, 1.8, 0.25, ((1.0, 0.7), (0.5, 0.3))),
+    "ui": (520.0, 0.15, 0.3, ((1.0, 1.0),)),
+    "effects": (440.0, 0.35, 0.6, ((1.0, 0.8), (1.5, 0.2))),
+}
+
+# Key substrings that retune effect placeholders, checked in order.
+_PLACEHOLDER_KEY_FREQUENCIES: Tuple[Tuple[str, float], ...] = (
+    ("collapse", 240.0),
+    ("hit_tank", 380.0),
+    ("impact", 320.0),
+    ("explosion_large", 180.0),
+    ("explosion", 220.0),
+)
+
+
+# SDL reports some backends under longer names than SDL_AUDIODRIVER accepts.
+_SDL_DRIVER_ALIASES: Dict[str, str] = {"pulse": "pulseaudio"}
+
+
+@lru_cache(maxsize=1)
+def _sdl_audio_drivers() -> Optional[frozenset[str]]:
+    """Return the audio backends compiled into SDL, or ``None`` if unknown."""
+
+    try:
+        import ctypes
+        import ctypes.util
+    except ImportError:  # pragma: no cover - e.g. WebAssembly builds
+        return None
+
+    def candidates():
+        # Probe the SDL that pygame actually loaded (bundled with wheels)
+        # first; a system libSDL2 may be a different build with other drivers,
+        # and find_library spawns ldconfig/gcc, so it is only a last resort.
+        package_dir = os.path.dirname(pygame.__file__)
+        for folder in (package_dir, os.path.join(package_dir, ".dylibs"), package_dir + ".libs"):
+            for path in sorted(glob.glob(os.path.join(folder, "*SDL2*"))):
+                if not any(part in os.path.basename(path) for part in ("_image", "_mixer", "_ttf")):
+                    yield path
+        yield ctypes.util.find_library("SDL2")
+
+    for library in candidates():
+        if not library:
+            continue
+        try:
+            sdl = ctypes.CDLL(library)
+            sdl.SDL_GetAudioDriver.restype = ctypes.c_char_p
+            count = sdl.SDL_GetNumAudioDrivers()
+            names = (sdl.SDL_GetAudioDriver(index) for index in range(count))
+            return frozenset(name.decode() for name in names if name)
+        except (AttributeError, OSError):
+            continue
+    return None
+
+
+# Volume slots; categories outside this table get a slot on first use.
+_MASTER_SLOT = 0
+_DEFAULT_VOLUMES: Tuple[Tuple[str, float], ...] = (
+    ("master", 1.0),
+    ("effects", 1.0),
+    ("ambient", 0.8),
+    ("ui", 0.8),
+)
+
+
+def _clamp01(value: float) -> float:
+    return 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+
+
+@lru_cache(maxsize=8)
+def _envelope(total_samples: int, attack: int, release: int) -> array:
+    """Linear attack/sustain/release gain curve shared by placeholder tones."""
+
+    gains = array("d", bytes(total_samples * 8))
+    for index in range(total_samples):
+        if index < attack:
+            gains[index] = index / attack
+        elif index > total_samples - release:
+            gains[index] = max(0.0, (total_samples - index) / release)
+        else:
+            gains[index] = 1.0
+    return gains
+
+
+@lru_cache(maxsize=32)
+def _synthesize_tone(
+    profile: _PlaceholderProfile, sample_rate: int, channels: int, full_rate: bool = False
+) -> bytes:
+    """Render a mono placeholder tone as interleaved int16 PCM, memoised per profile.
+
+    Unless ``full_rate`` is set, the tone is synthesised at roughly
+    ``_PLACEHOLDER_SYNTH_RATE`` and linearly interpolated up to ``sample_rate``.
+    """
+
+    base_freq, duration, amplitude, harmonics = profile
+
+    factor = 1 if full_rate else max(1, sample_rate // _PLACEHOLDER_SYNTH_RATE)
+    synth_rate = sample_rate / factor
+    total_samples = max(1, int(synth_rate * duration))
+    attack = max(1, int(total_samples * 0.03))
+    release = max(1, int(total_samples * 0.08))
+    scale = int(32767 * amplitude)
+
+    phase_scale = _SINE_TABLE_SIZE * (1 << _PHASE_FRACTION_BITS) / synth_rate
+    oscillators = [
+        (int(base_freq * harmonic * phase_scale), weight) for harmonic, weight in harmonics
+    ]
+    phases = [0] * len(oscillators)
+    sine = _SINE
+    shift = _PHASE_FRACTION_BITS
+    mask = _SINE_TABLE_MASK
+
+    envelope = _envelope(total_samples, attack, release)
+    wave = array("h", bytes(total_samples * 2))
+    for index in range(total_samples):
+        sample_value = 0.0
+        for slot, (increment, weight) in enumerate(oscillators):
+            phase = phases[slot]
+            sample_value += weight * sine[(phase >> shift) & mask]
+            phases[slot] = phase + increment
+        sample_value = max(-1.0, min(1.0, sample_value)) * envelope[index]
+        wave[index] = int(scale * sample_value)
+
+    stride = channels * factor
+    if stride == 1:
+        return wave.tobytes()
+    # The mixer reads buffers at its own rate and channel layout. Each output
+    # phase between two low-rate samples is one linear blend of the wave and
+    # its successor, fanned out to every channel with a strided slice copy.
+    following = wave[1:]
+    following.append(wave[-1])
+    data = bytearray(total_samples * stride * 2)
+    samples = memoryview(data).cast("h")
+    for step in range(factor):
+        if step:
+            blended = array(
+                "h", [a + (b - a) * step // factor for a, b in zip(wave, following)]
+            )
+        else:
+            blended = wave
+        for channel in range(channels):
+            samples[step * channels + channel :: stride] = blended
+    samples.release()
+    return bytes(data)
+
 
 class Soundscape:
     """High-level mixer facade that groups sounds by category."""
 
+    _cached_driver: Optional[str] = None
+
     def __init__(
         self,
         base_path: Path,
@@ -27,14 +192,17 @@ class Soundscape:
         self.base_path = Path(base_path)
         self.enabled = enabled
         self._mixer_ready = False
-        self._registry: Dict[str, pygame.mixer.Sound] = {}
-        self._categories: Dict[str, str] = {}
-        self._volumes: Dict[str, float] = {
-            "master": 1.0,
-            "effects": 1.0,
-            "ambient": 0.8,
-            "ui": 0.8,
+        # Parallel per-sound columns; ``_key_index`` maps a key to its slot.
+        self._keys: List[str] = []
+        self._sounds: List[pygame.mixer.Sound] = []
+        self._sound_slots: List[int] = []
+        self._key_index: Dict[str, int] = {}
+        self._sound_to_key: Dict[int, str] = {}
+        self._category_names: List[str] = [name for name, _ in _DEFAULT_VOLUMES]
+        self._category_slots: Dict[str, int] = {
+            name: slot for slot, name in enumerate(self._category_names)
         }
+        self._volumes = array("d", [volume for _, volume in _DEFAULT_VOLUMES])
         self._missing_assets_reported: set[str] = set()
         self._ambient_channel: Optional[pygame.mixer.Channel] = None
         self._status_message: Optional[str] = None
@@ -47,6 +215,7 @@ class Soundscape:
             "buffer": buffer,
         }
         self._ensure_base_path()
+        self._asset_index = self._scan_assets()
 
         if not enabled:
             return
@@ -62,7 +231,7 @@ class Soundscape:
         path = self.base_path / filename
         sound: Optional[pygame.mixer.Sound]
         try:
-            if path.is_file():
+            if Path(filename).as_posix() in self._asset_index:
                 sound = pygame.mixer.Sound(path.as_posix())
             else:
                 sound = None
@@ -75,39 +244,48 @@ class Soundscape:
                 return
             self._report_missing_asset(filename)
 
-        self._registry[key] = sound
-        self._categories[key] = category
+        index = self._key_index.get(key)
+        if index is None:
+            self._key_index[key] = len(self._keys)
+            self._keys.append(key)
+            self._sounds.append(sound)
+            self._sound_slots.append(self._category_slot(category))
+        else:
+            self._sound_to_key.pop(id(self._sounds[index]), None)
+            self._sounds[index] = sound
+            self._sound_slots[index] = self._category_slot(category)
+        self._sound_to_key[id(sound)] = key
 
     def play(self, key: str, *, loops: int = 0, volume: Optional[float] = None) -> None:
         self.ensure_ready()
         if not self._mixer_ready:
             return
-        sound = self._registry.get(key)
-        if sound is None:
+        index = self._key_index.get(key)
+        if index is None:
             return
-        category = self._categories.get(key, "effects")
-        vol = self._volumes.get("master", 1.0) * self._volumes.get(category, 1.0)
+        sound = self._sounds[index]
+        vol = self._volumes[_MASTER_SLOT] * self._volumes[self._sound_slots[index]]
         if volume is not None:
             vol *= volume
-        sound.set_volume(max(0.0, min(1.0, vol)))
+        sound.set_volume(_clamp01(vol))
         sound.play(loops=loops)
 
     def play_loop(self, key: str) -> None:
         self.ensure_ready()
         if not self._mixer_ready:
             return
-        sound = self._registry.get(key)
-        if sound is None:
+        index = self._key_index.get(key)
+        if index is None:
             return
+        sound = self._sounds[index]
         channel = self._ambient_channel
         if channel is None:
             channel = pygame.mixer.find_channel()
             if channel is None:
                 return
             self._ambient_channel = channel
-        category = self._categories.get(key, "ambient")
-        vol = self._volumes.get("master", 1.0) * self._volumes.get(category, 1.0)
-        clamped = max(0.0, min(1.0, vol))
+        vol = self._volumes[_MASTER_SLOT] * self._volumes[self._sound_slots[index]]
+        clamped = _clamp01(vol)
         sound.set_volume(clamped)
         channel.set_volume(clamped)
         channel.play(sound, loops=-1)
@@ -120,7 +298,9 @@ class Soundscape:
     # Volume management
     def set_volume(self, category: str, value: float) -> None:
         self.ensure_ready()
-        self._volumes[category] = max(0.0, min(1.0, value))
+        slot = self._category_slot(category)
+        self._volumes[slot] = _clamp01(value)
+        self._refresh_volumes(slot)
         if (
             category in {"master", "ambient"}
             and self._ambient_channel
@@ -128,22 +308,37 @@ class Soundscape:
         ):
             key = self._current_ambient_key()
             if key:
-                category_key = self._categories.get(key, "ambient")
-                vol = self._volumes.get("master", 1.0) * self._volumes.get(
-                    category_key, 1.0
-                )
-                clamped = max(0.0, min(1.0, vol))
-                self._ambient_channel.set_volume(clamped)
-                sound = self._registry.get(key)
-                if sound is not None:
-                    sound.set_volume(clamped)
+                ambient_slot = self._sound_slots[self._key_index[key]]
+                vol = self._volumes[_MASTER_SLOT] * self._volumes[ambient_slot]
+                self._ambient_channel.set_volume(_clamp01(vol))
+
+    def _refresh_volumes(self, slot: int) -> None:
+        """Push effective volumes to every sound affected by volume ``slot``."""
+
+        volumes = self._volumes
+        master = volumes[_MASTER_SLOT]
+        for sound, sound_slot in zip(self._sounds, self._sound_slots):
+            if slot == _MASTER_SLOT or sound_slot == slot:
+                sound.set_volume(_clamp01(master * volumes[sound_slot]))
 
     def get_volume(self, category: str) -> float:
-        return self._volumes.get(category, 1.0)
+        slot = self._category_slots.get(category)
+        return 1.0 if slot is None else self._volumes[slot]
+
+    def _category_slot(self, category: str) -> int:
+        slot = self._category_slots.get(category)
+        if slot is None:
+            slot = len(self._category_names)
+            self._category_names.append(category)
+            self._category_slots[category] = slot
+            self._volumes.append(1.0)
+        return slot
 
     # ------------------------------------------------------------------
     def ensure_ready(self) -> None:
-        if self._mixer_ready or not self.enabled:
+        if self._mixer_ready:
+            return
+        if not self.enabled:
             return
         self._initialise_mixer()
 
@@ -154,6 +349,16 @@ class Soundscape:
             except OSError:
                 pass
 
+    def _scan_assets(self) -> set[str]:
+        """Snapshot asset paths relative to ``base_path`` in one directory walk."""
+
+        index: set[str] = set()
+        for root, _dirs, files in os.walk(self.base_path):
+            folder = Path(root).relative_to(self.base_path)
+            for name in files:
+                index.add((folder / name).as_posix())
+        return index
+
     def _initialise_mixer(self) -> None:
         if self._mixer_ready or not self.enabled:
             return
@@ -177,6 +382,8 @@ class Soundscape:
                     "SDL_AUDIODRIVER"
                 )
                 self._active_driver = actual_driver
+                if actual_driver not in (None, "dummy"):
+                    Soundscape._cached_driver = actual_driver
                 if actual_driver == "dummy":
                     self._set_status_message(
                         "Audio device unavailable; running with SDL 'dummy' driver (no sound output). "
@@ -200,6 +407,7 @@ class Soundscape:
         if original:
             return [original]
         ordered: list[Optional[str]] = [
+            Soundscape._cached_driver,
             None,
             "pulse",
             "pipewire",
@@ -211,11 +419,18 @@ class Soundscape:
             "dsp",
             "dummy",
         ]
+        available = _sdl_audio_drivers()
         seen: set[Optional[str]] = set()
         result: list[Optional[str]] = []
         for driver in ordered:
             if driver in seen:
                 continue
+            if (
+                available is not None
+                and driver is not None
+                and _SDL_DRIVER_ALIASES.get(driver, driver) not in available
+            ):
+                continue
             seen.add(driver)
             result.append(driver)
         if result[-1] != "dummy":
@@ -246,10 +461,7 @@ class Soundscape:
         current = self._ambient_channel.get_sound()
         if current is None:
             return None
-        for key, sound in self._registry.items():
-            if sound == current:
-                return key
-        return None
+        return self._sound_to_key.get(id(current))
 
     def _report_missing_asset(self, filename: str) -> None:
         if filename in self._missing_assets_reported:
@@ -257,6 +469,15 @@ class Soundscape:
         self._missing_assets_reported.add(filename)
         print(f"[Soundscape] Missing audio asset '{filename}', using placeholder tone.")
 
+    @property
+    def _registry(self) -> Mapping[str, pygame.mixer.Sound]:
+        return dict(zip(self._keys, self._sounds))
+
+    @property
+    def _categories(self) -> Mapping[str, str]:
+        names = self._category_names
+        return {key: names[slot] for key, slot in zip(self._keys, self._sound_slots)}
+
     @property
     def status_message(self) -> Optional[str]:
         return self._status_message
@@ -272,82 +493,33 @@ class Soundscape:
         if width != 16:
             return None
 
-        duration = self._placeholder_duration(category)
-        base_freq = self._placeholder_frequency(key, category)
-        harmonics = self._placeholder_harmonics(category)
-        amplitude = self._placeholder_amplitude(category)
-
-        total_samples = max(1, int(sample_rate * duration))
-        attack = max(1, int(total_samples * 0.03))
-        release = max(1, int(total_samples * 0.08))
-        scale = int(32767 * amplitude)
-
-        wave = array("h")
-        for index in range(total_samples):
-            t = index / sample_rate
-            envelope = 1.0
-            if index < attack:
-                envelope = index / attack
-            elif index > total_samples - release:
-                envelope = max(0.0, (total_samples - index) / release)
-
-            sample_value = 0.0
-            for harmonic, weight in harmonics:
-                sample_value += weight * math.sin(2.0 * math.pi * base_freq * harmonic * t)
-            sample_value = max(-1.0, min(1.0, sample_value)) * envelope
-            wave.append(int(scale * sample_value))
-
-        if channels == 2:
-            stereo = array("h")
-            for sample in wave:
-                stereo.extend([sample, sample])
-            data = stereo.tobytes()
-        else:
-            data = wave.tobytes()
+        profile = self._resolve_profile(key, category)
+        # The looping ambient bed is long-lived and always audible, so it is
+        # rendered at the mixer rate; short cues take the cheaper low-rate path.
+        full_rate = category == "ambient" or "ambient" in key.lower()
+        data = _synthesize_tone(profile, sample_rate, channels, full_rate)
 
         try:
             return pygame.mixer.Sound(buffer=data)
         except pygame.error:
             return None
 
-    def _placeholder_frequency(self, key: str, category: str) -> float:
+    def _resolve_profile(self, key: str, category: str) -> _PlaceholderProfile:
+        _, duration, amplitude, harmonics = _PLACEHOLDER_PROFILES.get(
+            category, _PLACEHOLDER_PROFILES["effects"]
+        )
         key = key.lower()
         if "ambient" in key or category == "ambient":
-            return 170.0
-        if "menu" in key or category == "ui":
-            return 660.0 if "select" in key else 520.0
-        if "collapse" in key:
-            return 240.0
-        if "hit_tank" in key:
-            return 380.0
-        if "impact" in key:
-            return 320.0
-        if "explosion_large" in key:
-            return 180.0
-        if "explosion" in key:
-            return 220.0
-        return 440.0
-
-    def _placeholder_duration(self, category: str) -> float:
-        if category == "ambient":
-            return 1.8
-        if category == "ui":
-            return 0.15
-        return 0.35
-
-    def _placeholder_amplitude(self, category: str) -> float:
-        if category == "ambient":
-            return 0.25
-        if category == "ui":
-            return 0.3
-        return 0.6
-
-    def _placeholder_harmonics(self, category: str) -> list[tuple[float, float]]:
-        if category == "ambient":
-            return [(1.0, 0.7), (0.5, 0.3)]
-        if category == "ui":
-            return [(1.0, 1.0)]
-        return [(1.0, 0.8), (1.5, 0.2)]
+            frequency = _PLACEHOLDER_PROFILES["ambient"][0]
+        elif "menu" in key or category == "ui":
+            frequency = 660.0 if "select" in key else _PLACEHOLDER_PROFILES["ui"][0]
+        else:
+            frequency = _PLACEHOLDER_PROFILES["effects"][0]
+            for fragment, tuned in _PLACEHOLDER_KEY_FREQUENCIES:
+                if fragment in key:
+                    frequency = tuned
+                    break
+        return frequency, duration, amplitude, harmonics
 
 
 __all__ = ["Soundscape"]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
 from typing import List, Optional
 
 import pygame
@@ -18,15 +20,18 @@ class SuperpowerBase:
         self.enemy_index = 1 - player_index
         self.direction = 1 if player_index == 0 else -1
         self.cell = app.cell_size
+        self._inv_cell = 1.0 / self.cell
         self.offset_x = app.playfield_offset_x
         self.offset_y = app.ui_height
         self.world_width = app.world_width
         self.world_height = app.world_height
         self.screen_height = self.offset_y + self.world_height * self.cell
+        # Per-power generator, seeded from the global one so runs stay reproducible.
+        self.rng = random.Random(random.getrandbits(32))
 
     def screen_to_world(self, x_px: float, y_px: float) -> tuple[float, float]:
-        x_world = (x_px - self.offset_x) / self.cell
-        y_world = (y_px - self.offset_y) / self.cell
+        x_world = (x_px - self.offset_x) * self._inv_cell
+        y_world = (y_px - self.offset_y) * self._inv_cell
         x_world = max(0.0, min(self.world_width - 1e-3, x_world))
         y_world = max(0.0, min(self.world_height - 1e-3, y_world))
         return x_world, y_world
@@ -57,6 +62,31 @@ class SuperpowerBase:
         self.app._apply_superpower_damage(x_world, y_world, damage_scale, explosion_scale)
 
 
+@lru_cache(maxsize=4)
+def _bomber_sprite(
+    direction: int, body_w: int, body_h: int, wing_span: int
+) -> tuple[pygame.Surface, tuple[int, int]]:
+    """Pre-render the bomber airframe; returns the sprite and its centre anchor."""
+
+    half_w = max(wing_span // 2, body_w // 2 + 10) + 1
+    half_h = max(body_h // 2, 10) + 1
+    sprite = pygame.Surface((half_w * 2 + 1, half_h * 2 + 1), pygame.SRCALPHA)
+    x, y = half_w, half_h
+    body_rect = pygame.Rect(x - body_w // 2, y - body_h // 2, body_w, body_h)
+    pygame.draw.ellipse(sprite, (160, 40, 40), body_rect)
+    wing = pygame.Rect(x - wing_span // 2, y - 6, wing_span, 12)
+    pygame.draw.ellipse(sprite, (120, 25, 25), wing)
+    cockpit = pygame.Rect(x + direction * 10 - 14, y - 6, 24, 12)
+    pygame.draw.ellipse(sprite, (210, 210, 230), cockpit)
+    tail = [
+        (x - direction * body_w // 2, y),
+        (x - direction * (body_w // 2 + 10), y - 10),
+        (x - direction * (body_w // 2 + 10), y + 10),
+    ]
+    pygame.draw.polygon(sprite, (120, 25, 25), tail)
+    return sprite.convert_alpha(), (half_w, half_h)
+
+
 class BomberPower(SuperpowerBase):
     """Air strike that drops bombs across the opponent's position."""
 
@@ -79,15 +109,32 @@ class BomberPower(SuperpowerBase):
         target_tank = app.logic.tanks[self.enemy_index]
         target_x = self.offset_x + (target_tank.x + 0.5) * self.cell
         spread_px = self.cell * 3.4
+        rng = self.rng
         self.drop_points = sorted(
-            [target_x + random.uniform(-spread_px, spread_px) for _ in range(5)],
+            [target_x + rng.uniform(-spread_px, spread_px) for _ in range(5)],
             reverse=self.direction < 0,
         )
-        self.bombs: List[dict[str, float]] = []
+        # (jitter, vx, vy) for each bomb, drawn up front.
+        self._release_params = [
+            (
+                rng.uniform(-12.0, 12.0),
+                self.direction * rng.uniform(35.0, 85.0),
+                rng.uniform(-5.0, 15.0),
+            )
+            for _ in self.drop_points
+        ]
+        # Falling bombs as parallel columns (structure of arrays).
+        self.bomb_x: List[float] = []
+        self.bomb_y: List[float] = []
+        self.bomb_vx: List[float] = []
+        self.bomb_vy: List[float] = []
+        self._bomb_sprite = pygame.Surface((11, 11), pygame.SRCALPHA)
+        pygame.draw.circle(self._bomb_sprite, (60, 60, 72), (5, 5), 5)
+        self._bomb_sprite = self._bomb_sprite.convert_alpha()
         self.finished = False
 
     def update(self, dt: float) -> bool:
-        if self.finished and not self.bombs:
+        if self.finished and not self.bomb_x:
             return True
 
         if not self.finished:
@@ -104,14 +151,24 @@ class BomberPower(SuperpowerBase):
             ):
                 self.finished = True
 
-        for bomb in list(self.bombs):
-            bomb["vy"] += self.gravity * dt
-            bomb["x"] += bomb["vx"] * dt
-            bomb["y"] += bomb["vy"] * dt
-            x_world, y_world = self.screen_to_world(bomb["x"], bomb["y"])
-            world = self.app.logic.world
+        if self.bomb_x:
+            self._update_bombs(dt)
+
+        return self.finished and not self.bomb_x
+
+    def _update_bombs(self, dt: float) -> None:
+        gravity_step = self.gravity * dt
+        bomb_vy = [vy + gravity_step for vy in self.bomb_vy]
+        bomb_x = [x + vx * dt for x, vx in zip(self.bomb_x, self.bomb_vx)]
+        bomb_y = [y + vy * dt for y, vy in zip(self.bomb_y, bomb_vy)]
+
+        world = self.app.logic.world
+        keep: List[int] = []
+        for index, (x_px, y_px) in enumerate(zip(bomb_x, bomb_y)):
+            x_world, y_world = self.screen_to_world(x_px, y_px)
             ground_height = world.ground_height(x_world)
             if ground_height is None:
+                keep.append(index)
                 continue
             rubble = world.rubble_hit_test(x_world, y_world)
             if y_world >= ground_height or rubble is not None:
@@ -121,42 +178,290 @@ class BomberPower(SuperpowerBase):
                     damage_scale=0.85,
                     explosion_scale=1.2,
                 )
-                self.bombs.remove(bomb)
+            else:
+                keep.append(index)
 
-        return self.finished and not self.bombs
+        if len(keep) == len(bomb_x):
+            self.bomb_x, self.bomb_y, self.bomb_vy = bomb_x, bomb_y, bomb_vy
+            return
+        self.bomb_x = [bomb_x[index] for index in keep]
+        self.bomb_y = [bomb_y[index] for index in keep]
+        self.bomb_vx = [self.bomb_vx[index] for index in keep]
+        self.bomb_vy = [bomb_vy[index] for index in keep]
 
     def _spawn_bomb(self, release_x: float) -> None:
-        jitter = random.uniform(-12.0, 12.0)
-        bomb = {
-            "x": release_x + jitter,
-            "y": self.y + self.body_h * 0.4,
-            "vx": self.direction * random.uniform(35.0, 85.0),
-            "vy": random.uniform(-5.0, 15.0),
-        }
-        self.bombs.append(bomb)
+        jitter, vx, vy = self._release_params.pop()
+        self.bomb_x.append(release_x + jitter)
+        self.bomb_y.append(self.y + self.body_h * 0.4)
+        self.bomb_vx.append(vx)
+        self.bomb_vy.append(vy)
 
     def draw(self, surface: pygame.Surface) -> None:
         if not self.finished:
-            x = int(self.x)
-            y = int(self.y)
-            body_rect = pygame.Rect(x - self.body_w // 2, y - self.body_h // 2, self.body_w, self.body_h)
-            pygame.draw.ellipse(surface, (160, 40, 40), body_rect)
-            wing = pygame.Rect(x - self.wing_span // 2, y - 6, self.wing_span, 12)
-            pygame.draw.ellipse(surface, (120, 25, 25), wing)
-            cockpit = pygame.Rect(x + self.direction * 10 - 14, y - 6, 24, 12)
-            pygame.draw.ellipse(surface, (210, 210, 230), cockpit)
-            tail = [
-                (x - self.direction * self.body_w // 2, y),
-                (x - self.direction * (self.body_w // 2 + 10), y - 10),
-                (x - self.direction * (self.body_w // 2 + 10), y + 10),
-            ]
-            pygame.draw.polygon(surface, (120, 25, 25), tail)
-
-        for bomb in self.bombs:
-            pygame.draw.circle(surface, (60, 60, 72), (int(bomb["x"]), int(bomb["y"])), 5)
-
-
-@dataclass
+            sprite, (anchor_x, anchor_y) = _bomber_sprite(
+                self.direction, self.body_w, self.body_h, self.wing_span
+            )
+            surface.blit(sprite, (int(self.x) - anchor_x, int(self.y) - anchor_y))
+
+        if self.bomb_x:
+            bomb_sprite = self._bomb_sprite
+            surface.blits(
+                [
+                    (bomb_sprite, (int(x_px) - 5, int(y_px) - 5))
+                    for x_px, y_px in zip(self.bomb_x, self.bomb_y)
+                ],
+                doreturn=False,
+            )
+
+
+@dataclass(frozen=True)
+class _SoldierMetrics:
+    """Pixel offsets of the soldier drawing, truncated once per scale."""
+
+    s1: int
+    s1_5: int
+    s2: int
+    s3: int
+    s4: int
+    s5: int
+    s6: int
+    s8: int
+    s10: int
+    s12: int
+    s14: int
+    s18: int
+    s20: int
+    s24: int
+    s26: int
+    s28: int
+    s30: int
+    stroke: int
+
+
+@lru_cache(maxsize=8)
+def _soldier_metrics(S: float) -> _SoldierMetrics:
+    return _SoldierMetrics(
+        s1=int(1 * S),
+        s1_5=int(1.5 * S),
+        s2=int(2 * S),
+        s3=int(3 * S),
+        s4=int(4 * S),
+        s5=int(5 * S),
+        s6=int(6 * S),
+        s8=int(8 * S),
+        s10=int(10 * S),
+        s12=int(12 * S),
+        s14=int(14 * S),
+        s18=int(18 * S),
+        s20=int(20 * S),
+        s24=int(24 * S),
+        s26=int(26 * S),
+        s28=int(28 * S),
+        s30=int(30 * S),
+        stroke=max(1, int(2 * S)),
+    )
+
+
+def _draw_soldier(
+    surf: pygame.Surface,
+    x: int,
+    y: int,
+    role: str,
+    mortar_open: bool,
+    facing_left: bool,
+    S: float,
+) -> None:
+    """Rasterise one stylised soldier anchored at ``(x, y)``."""
+
+    color_body = (60, 110, 80)
+    color_helmet = (80, 130, 90)
+    color_rifle = (40, 40, 48)
+    color_panzerfaust = (30, 30, 32)
+    color_mortar = (45, 45, 50)
+    color_detail = (200, 200, 200)
+    m = _soldier_metrics(S)
+
+    head_r = max(3, m.s6)
+    body_w = m.s14
+    body_h = m.s20
+    body_rect = pygame.Rect(0, 0, body_w, body_h)
+    body_rect.center = (int(x), int(y + 4 * S))
+
+    head_pos = (int(x), int(y - m.s6))
+    pygame.draw.circle(surf, color_helmet, head_pos, head_r)
+    pygame.draw.circle(surf, color_detail, head_pos, max(1, head_r // 3))
+
+    pygame.draw.rect(surf, color_body, body_rect, border_radius=max(2, m.s3))
+    pygame.draw.line(
+        surf, color_body, (x - m.s3, y + m.s14), (x - m.s3, y + m.s24), m.stroke
+    )
+    pygame.draw.line(
+        surf, color_body, (x + m.s3, y + m.s14), (x + m.s3, y + m.s24), m.stroke
+    )
+
+    pack_rect = pygame.Rect(0, 0, m.s8, m.s12)
+    pack_rect.center = (int(x - 0.6 * body_w), int(y + m.s3))
+    pygame.draw.rect(surf, (50, 80, 60), pack_rect, border_radius=m.stroke)
+
+    dir_mul = -1 if facing_left else 1
+    shoulder_y = y
+
+    if role == "panzerfaust":
+        pygame.draw.line(surf, color_body, (x, shoulder_y), (x + dir_mul * m.s8, shoulder_y), m.stroke)
+        tube_len = m.s30
+        tube_w = max(3, m.s5)
+        tx0 = int(x + dir_mul * (8 * S))
+        ty0 = shoulder_y - m.s3
+        tube = [
+            (tx0, ty0),
+            (tx0 + dir_mul * tube_len, ty0 - tube_w // 2),
+            (tx0 + dir_mul * tube_len, ty0 + tube_w // 2),
+        ]
+        pygame.draw.polygon(surf, color_panzerfaust, tube)
+        muzzle = (tx0 + dir_mul * (tube_len + m.s4), ty0)
+        pygame.draw.circle(surf, color_detail, muzzle, m.stroke)
+    elif role == "mortar":
+        if mortar_open:
+            base_x = int(x + dir_mul * m.s18)
+            base_y = int(y + m.s10)
+            leg_len = m.s12
+            pygame.draw.line(
+                surf, color_mortar, (base_x, base_y), (base_x - dir_mul * leg_len, base_y + m.s10), m.stroke
+            )
+            pygame.draw.line(
+                surf, color_mortar, (base_x, base_y), (base_x + dir_mul * leg_len, base_y + m.s10), m.stroke
+            )
+            tube_len = m.s28
+            tube_w = max(3, m.s5)
+            tube_end = (base_x + dir_mul * int(tube_len * 0.8), base_y - m.s14)
+            pygame.draw.line(surf, color_mortar, (base_x, base_y - m.s2), tube_end, tube_w)
+            pygame.draw.rect(surf, (80, 80, 85), (base_x - m.s4, base_y - m.s2, m.s8, m.s6))
+        else:
+            folded_x = int(x - dir_mul * m.s10)
+            folded_y = int(y)
+            pygame.draw.rect(
+                surf,
+                color_mortar,
+                (folded_x - m.s10, folded_y - m.s4, m.s20, m.s6),
+                border_radius=m.stroke,
+            )
+            pygame.draw.line(
+                surf,
+                color_detail,
+                (folded_x - m.s8, folded_y - m.s2),
+                (x - m.s3, folded_y + m.s2),
+                max(1, m.s1),
+            )
+    else:  # rifle
+        hand_x = int(x + dir_mul * m.s8)
+        hand_y = int(y + m.s2)
+        barrel_len = m.s28
+        barrel_w = max(2, m.s3)
+        stock = (x - dir_mul * m.s6, hand_y + m.s2)
+        pygame.draw.line(surf, color_rifle, stock, (int(hand_x), hand_y), m.stroke)
+        bx0 = int(hand_x)
+        by0 = hand_y - m.s1
+        bx1 = int(bx0 + dir_mul * barrel_len)
+        pygame.draw.line(surf, color_rifle, (bx0, by0), (bx1, by0), barrel_w)
+        pygame.draw.circle(
+            surf,
+            color_detail,
+            (int(bx0 + dir_mul * m.s8), by0),
+            max(1, m.s1_5),
+        )
+
+    shadow_w = int(body_w * 1.2)
+    shadow_h = m.s6
+    shadow_rect = pygame.Rect(0, 0, shadow_w, shadow_h)
+    shadow_rect.center = (int(x), int(y + m.s26))
+    s_surf = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
+    pygame.draw.ellipse(s_surf, (10, 10, 10, 100), (0, 0, shadow_rect.width, shadow_rect.height))
+    surf.blit(s_surf, shadow_rect.topleft)
+
+
+@lru_cache(maxsize=32)
+def _soldier_sprite(
+    role: str, mortar_open: bool, facing_left: bool, scale: float
+) -> tuple[pygame.Surface, tuple[int, int]]:
+    """Pre-render a soldier pose; returns the sprite and its ``(x, y)`` anchor."""
+
+    half_w = int(50 * scale) + 4
+    top = int(16 * scale) + 4
+    bottom = int(32 * scale) + 4
+    sprite = pygame.Surface((half_w * 2, top + bottom), pygame.SRCALPHA)
+    _draw_soldier(sprite, half_w, top, role, mortar_open, facing_left, scale)
+    return sprite.convert_alpha(), (half_w, top)
+
+
+class SquadPhase(IntEnum):
+    ADVANCE = 0
+    DEPLOY = 1
+    FIRE = 2
+    EXIT = 3
+
+
+class SoldierState(IntEnum):
+    ADVANCE = 0
+    DEPLOY = 1
+    READY = 2
+    FIRE = 3
+    EXIT = 4
+    LEFT = 5
+
+
+# Soldier states that no longer hold up the squad's deploy phase.
+_DEPLOY_SETTLED = frozenset(
+    {SoldierState.READY, SoldierState.FIRE, SoldierState.EXIT, SoldierState.LEFT}
+)
+
+
+@dataclass(slots=True)
+class Soldier:
+    role: str
+    x: float
+    y: float
+    engage_distance: float
+    state: SoldierState = SoldierState.ADVANCE
+    timer: float = 0.0
+    fired: bool = False
+    mortar_unfolded: bool = False
+
+
+def _render_soldier(
+    surface: pygame.Surface,
+    x: float,
+    y: float,
+    role: str,
+    *,
+    scale: float,
+    facing_left: bool,
+    mortar_open: bool,
+) -> None:
+    """Blit the cached sprite for one soldier with its feet anchored at ``(x, y)``."""
+
+    surface.blit(
+        *_soldier_blit(x, y, role, scale=scale, facing_left=facing_left, mortar_open=mortar_open)
+    )
+
+
+def _soldier_blit(
+    x: float,
+    y: float,
+    role: str,
+    *,
+    scale: float,
+    facing_left: bool,
+    mortar_open: bool,
+) -> tuple[pygame.Surface, tuple[int, int]]:
+    """Return the ``(sprite, topleft)`` pair that draws one soldier at ``(x, y)``."""
+
+    sprite, (anchor_x, anchor_y) = _soldier_sprite(
+        role, mortar_open and role == "mortar", facing_left, scale
+    )
+    return sprite, (int(x) - anchor_x, int(y) - anchor_y)
+
+
+@dataclass(slots=True)
 class SquadFlash:
     x: float
     y: float
@@ -172,36 +477,42 @@ class SquadPower(SuperpowerBase):
         start_world_x = max(0.5, min(self.world_width - 0.5, tank.x + 0.5))
         start_screen_x, start_screen_y = self.world_to_screen(start_world_x, tank.y - 0.1)
         self.base_y = start_screen_y
-        self.soldiers: List[dict] = []
+        self.soldiers: List[Soldier] = []
         spacing = self.cell * 2.2
         roles = ["panzerfaust", "panzerfaust", "mortar", "mortar", "rifle", "rifle"]
         for idx, role in enumerate(roles):
             offset = idx - (len(roles) - 1) / 2
             start_x = start_screen_x - self.direction * (3 * self.cell) + offset * spacing
             self.soldiers.append(
-                {
-                    "role": role,
-                    "x": start_x,
-                    "y": start_screen_y,
-                    "state": "advance",
-                    "timer": 0.0,
-                    "fired": False,
-                    "mortar_unfolded": False,
-                }
+                Soldier(
+                    role=role,
+                    x=start_x,
+                    y=start_screen_y,
+                    engage_distance=120 + self.rng.uniform(-20, 20),
+                )
             )
 
         enemy = app.logic.tanks[self.enemy_index]
         self.target_x = self.offset_x + (enemy.x + 0.5) * self.cell
         self.speed = 90.0
         self.flash_effects: List[SquadFlash] = []
+        self._flash_sprites = [self._make_flash(min(255, level * 32)) for level in range(9)]
         self.scale = max(0.6, min(1.0, self.cell / 28.0))
         self.spacing = spacing
         self.done = False
-        self.phase = "advance"
+        self.phase = SquadPhase.ADVANCE
         self.phase_timer = 0.0
+        self._exit_boundary = (
+            self.offset_x + self.world_width * self.cell + 220
+            if self.direction > 0
+            else self.offset_x - 220
+        )
         self.fire_order = list(range(len(self.soldiers)))
         self.fire_index = 0
         self.fire_timer = 0.0
+        self._fire_delays = [0.45 + self.rng.uniform(0.0, 0.15) for _ in self.fire_order]
+        self._target_jitter = [self.rng.uniform(-80, 80) for _ in self.fire_order]
+        self._prepare_sprites()
 
     def update(self, dt: float) -> bool:
         self._update_flashes(dt)
@@ -210,103 +521,103 @@ class SquadPower(SuperpowerBase):
 
         self.phase_timer += dt
 
-        if self.phase == "advance":
-            all_reached = True
-            for soldier in self.soldiers:
-                if soldier["state"] != "advance":
-                    continue
-                soldier["timer"] += dt
-                soldier["x"] += self.direction * self.speed * dt
-                soldier["y"] = self._ground_height_screen(soldier["x"])
-                engage_distance = 120 + random.uniform(-20, 20)
-                if (self.direction > 0 and soldier["x"] >= self.target_x - engage_distance) or (
-                    self.direction < 0 and soldier["x"] <= self.target_x + engage_distance
+        if self.phase == SquadPhase.ADVANCE:
+            for soldier in self._march(dt, SoldierState.ADVANCE):
+                engage_distance = soldier.engage_distance
+                if (self.direction > 0 and soldier.x >= self.target_x - engage_distance) or (
+                    self.direction < 0 and soldier.x <= self.target_x + engage_distance
                 ):
-                    soldier["state"] = "deploy"
-                    soldier["timer"] = 0.0
-                else:
-                    all_reached = False
-            if all_reached:
-                self.phase = "deploy"
+                    soldier.state = SoldierState.DEPLOY
+                    soldier.timer = 0.0
+            if all(soldier.state != SoldierState.ADVANCE for soldier in self.soldiers):
+                self.phase = SquadPhase.DEPLOY
                 self.phase_timer = 0.0
 
-        if self.phase == "deploy":
+        if self.phase == SquadPhase.DEPLOY:
             all_ready = True
             for soldier in self.soldiers:
-                if soldier["state"] == "deploy":
-                    soldier["timer"] += dt
-                    if soldier["role"] == "mortar" and soldier["timer"] >= 0.6:
-                        soldier["mortar_unfolded"] = True
-                    if soldier["timer"] >= 1.2:
-                        soldier["state"] = "ready"
-                        soldier["timer"] = 0.0
+                if soldier.state == SoldierState.DEPLOY:
+                    soldier.timer += dt
+                    if soldier.role == "mortar" and soldier.timer >= 0.6:
+                        soldier.mortar_unfolded = True
+                    if soldier.timer >= 1.2:
+                        soldier.state = SoldierState.READY
+                        soldier.timer = 0.0
                     else:
                         all_ready = False
-                elif soldier["state"] not in {"ready", "fire", "exit", "left"}:
+                elif soldier.state not in _DEPLOY_SETTLED:
                     all_ready = False
             if all_ready:
                 for soldier in self.soldiers:
-                    soldier["state"] = "fire"
-                    soldier["timer"] = 0.0
-                self.phase = "fire"
+                    soldier.state = SoldierState.FIRE
+                    soldier.timer = 0.0
+                self.phase = SquadPhase.FIRE
                 self.phase_timer = 0.0
                 self.fire_index = 0
                 self.fire_timer = 0.0
 
-        if self.phase == "fire":
+        if self.phase == SquadPhase.FIRE:
             self.fire_timer += dt
-            if self.fire_index < len(self.fire_order) and self.fire_timer >= 0.45 + random.uniform(0.0, 0.15):
+            if (
+                self.fire_index < len(self.fire_order)
+                and self.fire_timer >= self._fire_delays[self.fire_index]
+            ):
                 idx = self.fire_order[self.fire_index]
                 soldier = self.soldiers[idx]
-                if not soldier["fired"]:
+                if not soldier.fired:
                     self._fire_soldier(soldier)
-                    soldier["fired"] = True
+                    soldier.fired = True
                 self.fire_index += 1
                 self.fire_timer = 0.0
-            if self.fire_index >= len(self.fire_order) and all(s["fired"] for s in self.soldiers):
+            if self.fire_index >= len(self.fire_order) and all(s.fired for s in self.soldiers):
                 if self.phase_timer >= 1.0:
-                    self.phase = "exit"
+                    self.phase = SquadPhase.EXIT
                     self.phase_timer = 0.0
                     for soldier in self.soldiers:
-                        soldier["state"] = "exit"
-                        soldier["timer"] = 0.0
-
-        if self.phase == "exit":
-            all_left = True
-            boundary = (
-                self.offset_x + self.world_width * self.cell + 220
-                if self.direction > 0
-                else self.offset_x - 220
-            )
-            for soldier in self.soldiers:
-                if soldier["state"] == "exit":
-                    soldier["timer"] += dt
-                    soldier["x"] += self.direction * self.speed * dt
-                    soldier["y"] = self._ground_height_screen(soldier["x"])
-                    if (self.direction > 0 and soldier["x"] > boundary) or (
-                        self.direction < 0 and soldier["x"] < boundary
-                    ):
-                        soldier["state"] = "left"
-                    else:
-                        all_left = False
-                elif soldier["state"] != "left":
-                    all_left = False
-            if all_left:
+                        soldier.state = SoldierState.EXIT
+                        soldier.timer = 0.0
+
+        if self.phase == SquadPhase.EXIT:
+            boundary = self._exit_boundary
+            for soldier in self._march(dt, SoldierState.EXIT):
+                if (self.direction > 0 and soldier.x > boundary) or (
+                    self.direction < 0 and soldier.x < boundary
+                ):
+                    soldier.state = SoldierState.LEFT
+            if all(soldier.state == SoldierState.LEFT for soldier in self.soldiers):
                 self.done = True
                 return True
 
         return False
 
-    def _ground_height_screen(self, x_px: float) -> float:
-        x_world = max(0.0, min(self.world_width - 1e-3, (x_px - self.offset_x) / self.cell))
-        height = self.app.logic.world.ground_height(x_world)
-        if height is None:
-            height = self.world_height
-        return self.offset_y + (height - 0.2) * self.cell
-
-    def _fire_soldier(self, soldier: dict) -> None:
-        role = soldier["role"]
-        target_px = self.target_x + random.uniform(-80, 80)
+    def _march(self, dt: float, state: SoldierState) -> List[Soldier]:
+        """Walk every soldier in ``state`` one step along the ground; return them."""
+
+        step = self.direction * self.speed * dt
+        marched = [soldier for soldier in self.soldiers if soldier.state == state]
+        for soldier in marched:
+            soldier.timer += dt
+            soldier.x += step
+        heights = self._ground_heights_screen([soldier.x for soldier in marched])
+        for soldier, y in zip(marched, heights):
+            soldier.y = y
+        return marched
+
+    def _ground_heights_screen(self, xs_px: List[float]) -> List[float]:
+        limit = self.world_width - 1e-3
+        offset_x = self.offset_x
+        cell = self.cell
+        inv_cell = self._inv_cell
+        xs_world = [max(0.0, min(limit, (x_px - offset_x) * inv_cell)) for x_px in xs_px]
+        fallback = self.world_height
+        return [
+            self.offset_y + ((fallback if height is None else height) - 0.2) * cell
+            for height in self.app.logic.world.ground_heights(xs_world)
+        ]
+
+    def _fire_soldier(self, soldier: Soldier) -> None:
+        role = soldier.role
+        target_px = self.target_x + self._target_jitter[self.fire_index]
         target_y_px = self.offset_y + (self.app.logic.tanks[self.enemy_index].y - 0.25) * self.cell
         x_world, y_world = self.screen_to_world(target_px, target_y_px)
 
@@ -318,146 +629,57 @@ class SquadPower(SuperpowerBase):
         else:  # rifle
             self.apply_damage(x_world, y_world, damage_scale=0.4, explosion_scale=0.65)
 
-        self.flash_effects.append(SquadFlash(soldier["x"], soldier["y"] - 18, 0.25))
+        self.flash_effects.append(SquadFlash(soldier.x, soldier.y - 18, 0.25))
 
     def _update_flashes(self, dt: float) -> None:
-        for flash in list(self.flash_effects):
+        if not self.flash_effects:
+            return
+        for flash in self.flash_effects:
             flash.life -= dt
-            if flash.life <= 0:
-                self.flash_effects.remove(flash)
+        self.flash_effects = [flash for flash in self.flash_effects if flash.life > 0]
 
     def draw(self, surface: pygame.Surface) -> None:
         if not self.soldiers:
             return
 
-        for soldier in self.soldiers:
-            self._draw_single_soldier(surface, soldier)
+        facing_left = self.direction < 0
+        batch = [
+            _soldier_blit(
+                soldier.x,
+                soldier.y,
+                soldier.role,
+                scale=self.scale,
+                facing_left=facing_left,
+                mortar_open=soldier.mortar_unfolded,
+            )
+            for soldier in self.soldiers
+        ]
+        flash_shift = 18 if self.direction > 0 else 0
         for flash in self.flash_effects:
             alpha = max(0, min(255, int(255 * (flash.life / 0.25))))
-            flash_surface = pygame.Surface((18, 8), pygame.SRCALPHA)
-            pygame.draw.polygon(
-                flash_surface,
-                (255, 230, 120, alpha),
-                [(0, 4), (18, 0), (18, 8)],
-            )
-            surface.blit(
-                flash_surface,
-                (
-                    flash.x - (18 if self.direction > 0 else 0),
-                    flash.y,
-                ),
+            batch.append(
+                (self._flash_sprites[(alpha + 16) // 32], (flash.x - flash_shift, flash.y))
             )
+        surface.blits(batch, doreturn=False)
 
-    def _draw_single_soldier(self, surface: pygame.Surface, soldier: dict) -> None:
-        x = soldier["x"]
-        y = soldier["y"]
-        S = self.scale
-        facing_left = self.direction < 0
+    def _prepare_sprites(self) -> None:
+        """Render every pose this squad can show for its fixed scale up front."""
 
-        color_body = (60, 110, 80)
-        color_helmet = (80, 130, 90)
-        color_rifle = (40, 40, 48)
-        color_panzerfaust = (30, 30, 32)
-        color_mortar = (45, 45, 50)
-        color_detail = (200, 200, 200)
-
-        head_r = max(3, int(6 * S))
-        body_w = int(14 * S)
-        body_h = int(20 * S)
-        body_rect = pygame.Rect(0, 0, body_w, body_h)
-        body_rect.center = (int(x), int(y + 4 * S))
-
-        head_pos = (int(x), int(y - int(6 * S)))
-        pygame.draw.circle(surface, color_helmet, head_pos, head_r)
-        pygame.draw.circle(surface, color_detail, head_pos, max(1, head_r // 3))
-
-        pygame.draw.rect(surface, color_body, body_rect, border_radius=max(2, int(3 * S)))
-        pygame.draw.line(
-            surface, color_body, (x - int(3 * S), y + int(14 * S)), (x - int(3 * S), y + int(24 * S)), max(1, int(2 * S))
-        )
-        pygame.draw.line(
-            surface, color_body, (x + int(3 * S), y + int(14 * S)), (x + int(3 * S), y + int(24 * S)), max(1, int(2 * S))
+        facing_left = self.direction < 0
+        for role in {soldier.role for soldier in self.soldiers}:
+            _soldier_sprite(role, False, facing_left, self.scale)
+            if role == "mortar":
+                _soldier_sprite(role, True, facing_left, self.scale)
+
+    @staticmethod
+    def _make_flash(alpha: int) -> pygame.Surface:
+        flash_surface = pygame.Surface((18, 8), pygame.SRCALPHA)
+        pygame.draw.polygon(
+            flash_surface,
+            (255, 230, 120, alpha),
+            [(0, 4), (18, 0), (18, 8)],
         )
-
-        pack_rect = pygame.Rect(0, 0, int(8 * S), int(12 * S))
-        pack_rect.center = (int(x - 0.6 * body_w), int(y + int(3 * S)))
-        pygame.draw.rect(surface, (50, 80, 60), pack_rect, border_radius=max(1, int(2 * S)))
-
-        dir_mul = -1 if facing_left else 1
-        shoulder_y = y + int(0 * S)
-
-        role = soldier["role"]
-        if role == "panzerfaust":
-            pygame.draw.line(surface, color_body, (x, shoulder_y), (x + dir_mul * int(8 * S), shoulder_y), max(1, int(2 * S)))
-            tube_len = int(30 * S)
-            tube_w = max(3, int(5 * S))
-            tx0 = int(x + dir_mul * (8 * S))
-            ty0 = shoulder_y - int(3 * S)
-            tube = [
-                (tx0, ty0),
-                (tx0 + dir_mul * tube_len, ty0 - tube_w // 2),
-                (tx0 + dir_mul * tube_len, ty0 + tube_w // 2),
-            ]
-            pygame.draw.polygon(surface, color_panzerfaust, tube)
-            muzzle = (tx0 + dir_mul * (tube_len + int(4 * S)), ty0)
-            pygame.draw.circle(surface, color_detail, muzzle, max(1, int(2 * S)))
-        elif role == "mortar":
-            if soldier["mortar_unfolded"]:
-                base_x = int(x + dir_mul * int(18 * S))
-                base_y = int(y + int(10 * S))
-                leg_len = int(12 * S)
-                pygame.draw.line(
-                    surface, color_mortar, (base_x, base_y), (base_x - dir_mul * leg_len, base_y + int(10 * S)), max(1, int(2 * S))
-                )
-                pygame.draw.line(
-                    surface, color_mortar, (base_x, base_y), (base_x + dir_mul * leg_len, base_y + int(10 * S)), max(1, int(2 * S))
-                )
-                tube_len = int(28 * S)
-                tube_w = max(3, int(5 * S))
-                tube_end = (base_x + dir_mul * int(tube_len * 0.8), base_y - int(14 * S))
-                pygame.draw.line(surface, color_mortar, (base_x, base_y - int(2 * S)), tube_end, tube_w)
-                pygame.draw.rect(surface, (80, 80, 85), (base_x - int(4 * S), base_y - int(2 * S), int(8 * S), int(6 * S)))
-            else:
-                folded_x = int(x - dir_mul * int(10 * S))
-                folded_y = int(y + int(0 * S))
-                pygame.draw.rect(
-                    surface,
-                    color_mortar,
-                    (folded_x - int(10 * S), folded_y - int(4 * S), int(20 * S), int(6 * S)),
-                    border_radius=max(1, int(2 * S)),
-                )
-                pygame.draw.line(
-                    surface,
-                    color_detail,
-                    (folded_x - int(8 * S), folded_y - int(2 * S)),
-                    (x - int(3 * S), folded_y + int(2 * S)),
-                    max(1, int(1 * S)),
-                )
-        else:
-            hand_x = int(x + dir_mul * int(8 * S))
-            hand_y = int(y + int(2 * S))
-            barrel_len = int(28 * S)
-            barrel_w = max(2, int(3 * S))
-            stock = (x - dir_mul * int(6 * S), hand_y + int(2 * S))
-            pygame.draw.line(surface, color_rifle, stock, (int(hand_x), hand_y), max(1, int(2 * S)))
-            bx0 = int(hand_x)
-            by0 = hand_y - int(1 * S)
-            bx1 = int(bx0 + dir_mul * barrel_len)
-            pygame.draw.line(surface, color_rifle, (bx0, by0), (bx1, by0), barrel_w)
-            pygame.draw.circle(
-                surface,
-                color_detail,
-                (int(bx0 + dir_mul * int(8 * S)), by0),
-                max(1, int(1.5 * S)),
-            )
-
-        shadow_w = int(body_w * 1.2)
-        shadow_h = int(6 * S)
-        shadow_rect = pygame.Rect(0, 0, shadow_w, shadow_h)
-        shadow_rect.center = (int(x), int(y + int(26 * S)))
-        s_surf = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        pygame.draw.ellipse(s_surf, (10, 10, 10, 100), (0, 0, shadow_rect.width, shadow_rect.height))
-        surface.blit(s_surf, shadow_rect.topleft)
+        return flash_surface
 
 
 class SuperpowerManager:
@@ -534,115 +756,17 @@ def draw_squad(
     total_width = (count - 1) * spacing * scale
     start_x = cx - total_width / 2
 
-    color_body = (60, 110, 80)
-    color_helmet = (80, 130, 90)
-    color_rifle = (40, 40, 48)
-    color_panzerfaust = (30, 30, 32)
-    color_mortar = (45, 45, 50)
-    color_detail = (200, 200, 200)
-
     results: List[dict] = []
 
     def draw_soldier_at(surf, x, y, role: str, mortar_open=False):
-        S = scale
-        head_r = max(3, int(6 * S))
-        body_w = int(14 * S)
-        body_h = int(20 * S)
-        body_rect = pygame.Rect(0, 0, body_w, body_h)
-        body_rect.center = (int(x), int(y + 4 * S))
-
-        head_pos = (int(x), int(y - int(6 * S)))
-        pygame.draw.circle(surf, color_helmet, head_pos, head_r)
-        pygame.draw.circle(surf, color_detail, head_pos, max(1, head_r // 3))
-
-        pygame.draw.rect(surf, color_body, body_rect, border_radius=max(2, int(3 * S)))
-        pygame.draw.line(
-            surf, color_body, (x - int(3 * S), y + int(14 * S)), (x - int(3 * S), y + int(24 * S)), max(1, int(2 * S))
-        )
-        pygame.draw.line(
-            surf, color_body, (x + int(3 * S), y + int(14 * S)), (x + int(3 * S), y + int(24 * S)), max(1, int(2 * S))
+        m = _soldier_metrics(scale)
+        body_w = m.s14
+        body_h = m.s20
+        _render_soldier(
+            surf, x, y, role, scale=scale, facing_left=facing_left, mortar_open=bool(mortar_open)
         )
 
-        pack_rect = pygame.Rect(0, 0, int(8 * S), int(12 * S))
-        pack_rect.center = (int(x - 0.6 * body_w), int(y + int(3 * S)))
-        pygame.draw.rect(surf, (50, 80, 60), pack_rect, border_radius=max(1, int(2 * S)))
-
-        dir_mul = -1 if facing_left else 1
-        shoulder_y = y + int(0 * S)
-
-        if role == "panzerfaust":
-            pygame.draw.line(surf, color_body, (x, shoulder_y), (x + dir_mul * int(8 * S), shoulder_y), max(1, int(2 * S)))
-            tube_len = int(30 * S)
-            tube_w = max(3, int(5 * S))
-            tx0 = int(x + dir_mul * (8 * S))
-            ty0 = shoulder_y - int(3 * S)
-            tube = [
-                (tx0, ty0),
-                (tx0 + dir_mul * tube_len, ty0 - tube_w // 2),
-                (tx0 + dir_mul * tube_len, ty0 + tube_w // 2),
-            ]
-            pygame.draw.polygon(surf, color_panzerfaust, tube)
-            muzzle = (tx0 + dir_mul * (tube_len + int(4 * S)), ty0)
-            pygame.draw.circle(surf, color_detail, muzzle, max(1, int(2 * S)))
-        elif role == "mortar":
-            if mortar_open:
-                base_x = int(x + dir_mul * int(18 * S))
-                base_y = int(y + int(10 * S))
-                leg_len = int(12 * S)
-                pygame.draw.line(
-                    surf, color_mortar, (base_x, base_y), (base_x - dir_mul * leg_len, base_y + int(10 * S)), max(1, int(2 * S))
-                )
-                pygame.draw.line(
-                    surf, color_mortar, (base_x, base_y), (base_x + dir_mul * leg_len, base_y + int(10 * S)), max(1, int(2 * S))
-                )
-                tube_len = int(28 * S)
-                tube_w = max(3, int(5 * S))
-                tube_end = (base_x + dir_mul * int(tube_len * 0.8), base_y - int(14 * S))
-                pygame.draw.line(surf, color_mortar, (base_x, base_y - int(2 * S)), tube_end, tube_w)
-                pygame.draw.rect(surf, (80, 80, 85), (base_x - int(4 * S), base_y - int(2 * S), int(8 * S), int(6 * S)))
-            else:
-                folded_x = int(x - dir_mul * int(10 * S))
-                folded_y = int(y + int(0 * S))
-                pygame.draw.rect(
-                    surf,
-                    color_mortar,
-                    (folded_x - int(10 * S), folded_y - int(4 * S), int(20 * S), int(6 * S)),
-                    border_radius=max(1, int(2 * S)),
-                )
-                pygame.draw.line(
-                    surf,
-                    color_detail,
-                    (folded_x - int(8 * S), folded_y - int(2 * S)),
-                    (x - int(3 * S), folded_y + int(2 * S)),
-                    max(1, int(1 * S)),
-                )
-        else:  # rifle
-            hand_x = int(x + dir_mul * int(8 * S))
-            hand_y = int(y + int(2 * S))
-            barrel_len = int(28 * S)
-            barrel_w = max(2, int(3 * S))
-            stock = (x - dir_mul * int(6 * S), hand_y + int(2 * S))
-            pygame.draw.line(surf, color_rifle, stock, (int(hand_x), hand_y), max(1, int(2 * S)))
-            bx0 = int(hand_x)
-            by0 = hand_y - int(1 * S)
-            bx1 = int(bx0 + dir_mul * barrel_len)
-            pygame.draw.line(surf, color_rifle, (bx0, by0), (bx1, by0), barrel_w)
-            pygame.draw.circle(
-                surf,
-                color_detail,
-                (int(bx0 + dir_mul * int(8 * S)), by0),
-                max(1, int(1.5 * S)),
-            )
-
-        shadow_w = int(body_w * 1.2)
-        shadow_h = int(6 * S)
-        shadow_rect = pygame.Rect(0, 0, shadow_w, shadow_h)
-        shadow_rect.center = (int(x), int(y + int(26 * S)))
-        s_surf = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        pygame.draw.ellipse(s_surf, (10, 10, 10, 100), (0, 0, shadow_rect.width, shadow_rect.height))
-        surf.blit(s_surf, shadow_rect.topleft)
-
-        bounds = pygame.Rect(int(x - body_w), int(y - int(12 * S)), int(body_w * 2), int(body_h * 2 + int(10 * S)))
+        bounds = pygame.Rect(int(x - body_w), int(y - m.s12), int(body_w * 2), int(body_h * 2 + m.s10))
         return bounds
 
     roles = ["panzerfaust", "panzerfaust", "mortar", "mortar", "rifle", "rifle"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+from functools import lru_cache
 from typing import Tuple
 
 import pygame
@@ -17,18 +18,27 @@ def generate_noise_texture(
 ) -> pygame.Surface:
     """Create a tileable grayscale noise texture."""
 
+    min_b, max_b = brightness
+    return _noise_texture(size, alpha, seed, min_b, max_b).copy()
+
+
+@lru_cache(maxsize=8)
+def _noise_texture(size: int, alpha: int, seed: int, min_b: int, max_b: int) -> pygame.Surface:
     rng = random.Random(seed)
     small_size = max(8, size // 4)
-    small = pygame.Surface((small_size, small_size), pygame.SRCALPHA)
-    min_b, max_b = brightness
-    for y in range(small_size):
-        for x in range(small_size):
-            tone = rng.randint(min_b, max_b)
-            small.set_at((x, y), (tone, tone, tone, alpha))
+    pixels = small_size * small_size
+    span = max_b - min_b + 1
+    # Map raw random bytes onto the brightness range with a C-level translate.
+    tone_table = bytes(min_b + (value * span >> 8) for value in range(256))
+    tones = rng.randbytes(pixels).translate(tone_table)
+    rgba = bytearray(pixels * 4)
+    rgba[0::4] = tones
+    rgba[1::4] = tones
+    rgba[2::4] = tones
+    rgba[3::4] = bytes((alpha,)) * pixels
+    small = pygame.image.frombytes(bytes(rgba), (small_size, small_size), "RGBA")
 
     surface = pygame.transform.smoothscale(small, (size, size))
-    overlay = pygame.transform.smoothscale(small, (size, size))
-    surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
     return surface.convert_alpha()
 
 
@@ -42,8 +52,18 @@ def generate_cloud_layer(
 ) -> pygame.Surface:
     """Generate a soft cloud layer surface."""
 
+    return _cloud_layer(width, height, blobs, seed, base_alpha).copy()
+
+
+@lru_cache(maxsize=8)
+def _cloud_layer(
+    width: int, height: int, blobs: int, seed: int, base_alpha: int
+) -> pygame.Surface:
     rng = random.Random(seed)
-    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    # Blobs are soft and low-frequency, so rasterise them at half resolution.
+    small = pygame.Surface((max(1, width // 2), max(1, height // 2)), pygame.SRCALPHA)
+    # Transparent texels carry cloud colour so upscaled edges do not darken.
+    small.fill((238, 244, 255, 0))
     colors = [
         pygame.Color(255, 255, 255, int(base_alpha * 0.9)),
         pygame.Color(238, 244, 255, int(base_alpha * 0.75)),
@@ -55,9 +75,11 @@ def generate_cloud_layer(
         blob_h = rng.randint(height // 3, height // 2)
         x = rng.randint(-blob_w // 3, width)
         y = rng.randint(-blob_h // 2, height // 2)
-        color = random.choice(colors)
-        ellipse_rect = pygame.Rect(x, y, blob_w, blob_h)
-        pygame.draw.ellipse(surface, color, ellipse_rect)
+        color = rng.choice(colors)
+        ellipse_rect = pygame.Rect(x // 2, y // 2, max(1, blob_w // 2), max(1, blob_h // 2))
+        pygame.draw.ellipse(small, color, ellipse_rect)
+
+    surface = pygame.transform.smoothscale(small, (width, height))
 
     # Feather the edges very slightly
     feather = pygame.Surface((width, height), pygame.SRCALPHA)
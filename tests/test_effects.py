@@ -0,0 +1,16 @@
+import random
+
+import pytest
+
+from tanx_game.pygame.effects import EffectsSystem
+
+
+@pytest.mark.parametrize("dt", [1 / 30, 1 / 60, 1 / 120])
+def test_weather_refill_follows_elapsed_time(dt: float) -> None:
+    random.seed(1)
+    effects = EffectsSystem(cell_size=32, ui_height=100)
+    effects.set_weather("snow")
+    for _ in range(round(0.1 / dt)):
+        effects.update_weather(dt, 60, 36)
+    # One batch of 18 snowflakes per 1/60 s, independent of the update step.
+    assert len(effects.drop_x) == 18 * 6
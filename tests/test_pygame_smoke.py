@@ -89,3 +89,51 @@ def test_damage_settings_adjustment(monkeypatch, tmp_path) -> None:
         if app:
             app.running = False
         pygame.quit()
+
+
+@pytest.mark.smoke
+def test_crater_rebake_matches_full_bake(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    monkeypatch.setattr(config, "_SETTINGS_PATH", tmp_path / "user_settings.json", raising=False)
+
+    from tanx_game.pygame.renderer import scene
+
+    app = None
+    try:
+        app = PygameTanx(start_in_menu=False, debug=False, seed=3)
+        world = app.logic.world
+        scene.draw_world(app)
+        x = world.width * 0.4
+        world.carve_circle(x, world.ground_height(x), 2.5)
+        scene.draw_world(app)
+        partial = pygame.image.tobytes(app._terrain_surface, "RGBA")
+        scene._bake_terrain(app, world, app.cell_size, app.terrain_texture)
+        assert pygame.image.tobytes(app._terrain_surface, "RGBA") == partial
+    finally:
+        if app:
+            app.running = False
+        pygame.quit()
+
+
+@pytest.mark.smoke
+def test_resolution_change_keeps_world(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    monkeypatch.setattr(config, "_SETTINGS_PATH", tmp_path / "user_settings.json", raising=False)
+
+    app = None
+    try:
+        app = PygameTanx(start_in_menu=True, debug=False)
+        app._action_open_settings()
+        world = app.logic.world
+        cell_size = app.cell_size
+        app._change_resolution(1)
+        assert app.cell_size != cell_size
+        assert app.logic.world is world
+        assert app.effects.cell_size == app.cell_size
+        assert app.screen.get_width() >= world.width * app.cell_size
+    finally:
+        if app:
+            app.running = False
+        pygame.quit()
@@ -0,0 +1,23 @@
+from tanx_game.core.game import Game
+from tanx_game.core.session import GameSession
+
+
+def test_update_projectile_advances_whole_intervals(flat_settings):
+    game = Game(settings=flat_settings)
+    session = GameSession(game, projectile_interval=0.03)
+    result = session.begin_projectile(game.tanks[0])
+    path = result.path
+    assert len(path) > 4
+
+    assert session.update_projectile(0.02).trail_positions == []
+
+    step = session.update_projectile(0.05)
+    assert step.trail_positions == path[1:3]
+    assert session.projectile_position == path[2]
+    assert not step.finished
+
+    step = session.update_projectile(len(path) * 0.03)
+    assert step.finished
+    assert step.result is result
+    assert step.trail_positions == path[3:]
+    assert session.projectile_position is None
@@ -17,3 +17,16 @@ def test_sample_sdf_signs(flat_world: World):
 
     assert flat_world.sample_sdf(x + 0.25, surface - 2) > 0
     assert flat_world.sample_sdf(x + 0.25, surface + 2) < 0
+
+
+def test_ground_heights_matches_scalar_queries(flat_world: World):
+    xs = [-1.0, 0.0, 3.25, 11.5, flat_world.width - 0.5, flat_world.width + 1.0]
+
+    assert flat_world.ground_heights(xs) == [flat_world.ground_height(x) for x in xs]
+
+
+def test_carving_bumps_terrain_revision(flat_world: World):
+    before = flat_world.terrain_revision
+    flat_world.carve_circle(6.0, float(flat_world.surface_y(6)), 2.0)
+
+    assert flat_world.terrain_revision > before